@@ -6,61 +6,226 @@ Returns: HTTP response со списком сгенерированных сло
 
 import json
 import os
-from typing import Dict, Any, List
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import requests
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from psycopg2.extras import RealDictCursor, execute_values
+
+import db
+import genapi
+
+PROMPT_CACHE_TTL_HOURS = int(os.environ.get('PROMPT_CACHE_TTL_HOURS', '168'))
+PROMPT_CACHE_MAX_ENTRIES = int(os.environ.get('PROMPT_CACHE_MAX_ENTRIES', '5000'))
+PROMPT_CLAIM_LEASE = float(os.environ.get('PROMPT_CLAIM_LEASE', '60'))
+PROMPT_CLAIM_POLL = float(os.environ.get('PROMPT_CLAIM_POLL', '0.5'))
+
+def normalize_word(word: str) -> str:
+    return ' '.join(word.split()).lower()
 
 def generate_words_by_prompt(prompt: str, count: int = 15) -> List[Dict[str, Any]]:
-    api_key = os.environ.get('GENAPI_KEY', '')
-    if not api_key:
-        return []
-    
     try:
-        response = requests.post(
-            'https://api.gen-api.ru/api/v1/networks/o1-mini',
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                'Authorization': f'Bearer {api_key}'
-            },
-            json={
-                'is_sync': True,
-                'messages': [{
-                    'role': 'user',
-                    'content': f'На основе запроса пользователя: "{prompt}" - подбери {count} английских слов которые соответствуют этой теме. Для каждого слова дай русский перевод и 3 коротких примера использования на английском. Ответь ТОЛЬКО в формате JSON массива без дополнительного текста: [{{"word": "english_word", "translation": "русский перевод", "examples": ["Example 1", "Example 2", "Example 3"]}}]'
-                }],
-                'model': 'o1-mini-2024-09-12',
-                'stream': False,
-                'temperature': 1
-            },
+        content = genapi.complete(
+            f'На основе запроса пользователя: "{prompt}" - подбери {count} английских слов которые соответствуют этой теме. Для каждого слова дай русский перевод и 3 коротких примера использования на английском. Ответь ТОЛЬКО в формате JSON массива без дополнительного текста: [{{"word": "english_word", "translation": "русский перевод", "examples": ["Example 1", "Example 2", "Example 3"]}}]',
             timeout=45
         )
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            if 'output' in data and 'choices' in data['output']:
-                content = data['output']['choices'][0]['message']['content']
-                content_clean = content.strip()
-                
-                if content_clean.startswith('```json'):
-                    content_clean = content_clean[7:]
-                if content_clean.startswith('```'):
-                    content_clean = content_clean[3:]
-                if content_clean.endswith('```'):
-                    content_clean = content_clean[:-3]
-                content_clean = content_clean.strip()
-                
-                result = json.loads(content_clean)
-                return result[:count]
-            else:
-                return []
-        else:
-            return []
+        result = genapi.parse_json(content)
+        return result[:count]
     except Exception as e:
         return []
 
+def normalize_prompt(prompt: str) -> str:
+    return ' '.join(prompt.lower().split())[:500]
+
+def get_cached_prompt_words(cursor, prompt_key: str, count: int) -> Optional[List[Dict[str, Any]]]:
+    cursor.execute(
+        """UPDATE t_p7147437_shag_to_speak.prompt_cache
+           SET last_used_at = CURRENT_TIMESTAMP
+           WHERE prompt_key = %s AND word_count = %s
+             AND created_at >= CURRENT_TIMESTAMP - make_interval(hours => %s)
+           RETURNING words""",
+        (prompt_key, count, PROMPT_CACHE_TTL_HOURS)
+    )
+    cached = cursor.fetchone()
+    return cached['words'] if cached else None
+
+def save_prompt_words(cursor, prompt_key: str, count: int, words: List[Dict[str, Any]]) -> None:
+    cursor.execute(
+        """INSERT INTO t_p7147437_shag_to_speak.prompt_cache (prompt_key, word_count, words)
+           VALUES (%s, %s, %s::jsonb)
+           ON CONFLICT (prompt_key, word_count) DO UPDATE
+           SET words = EXCLUDED.words,
+               created_at = CURRENT_TIMESTAMP,
+               last_used_at = CURRENT_TIMESTAMP""",
+        (prompt_key, count, json.dumps(words, ensure_ascii=False))
+    )
+    cursor.execute(
+        """DELETE FROM t_p7147437_shag_to_speak.prompt_cache
+           WHERE created_at < CURRENT_TIMESTAMP - make_interval(hours => %s)
+              OR last_used_at < (
+                  SELECT last_used_at FROM t_p7147437_shag_to_speak.prompt_cache
+                  ORDER BY last_used_at DESC
+                  OFFSET %s LIMIT 1
+              )""",
+        (PROMPT_CACHE_TTL_HOURS, PROMPT_CACHE_MAX_ENTRIES - 1)
+    )
+
+def claim_prompt(cursor, prompt_key: str, count: int) -> bool:
+    cursor.execute(
+        """INSERT INTO t_p7147437_shag_to_speak.prompt_claims (prompt_key, word_count, lease_until)
+           VALUES (%s, %s, CURRENT_TIMESTAMP + make_interval(secs => %s))
+           ON CONFLICT (prompt_key, word_count) DO UPDATE
+           SET lease_until = EXCLUDED.lease_until
+           WHERE prompt_claims.lease_until < CURRENT_TIMESTAMP
+           RETURNING lease_until""",
+        (prompt_key, count, PROMPT_CLAIM_LEASE)
+    )
+    return cursor.fetchone() is not None
+
+def release_prompt_claim(cursor, prompt_key: str, count: int) -> None:
+    cursor.execute(
+        "DELETE FROM t_p7147437_shag_to_speak.prompt_claims WHERE prompt_key = %s AND word_count = %s",
+        (prompt_key, count)
+    )
+
+def get_words_for_prompt(prompt: str, count: int) -> List[Dict[str, Any]]:
+    prompt_key = normalize_prompt(prompt)
+    deadline = time.monotonic() + PROMPT_CLAIM_LEASE
+    
+    while True:
+        conn = db.get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        try:
+            cached = get_cached_prompt_words(cursor, prompt_key, count)
+            claimed = cached is None and claim_prompt(cursor, prompt_key, count)
+            conn.commit()
+        finally:
+            cursor.close()
+            db.release_connection(conn)
+        
+        if cached is not None:
+            return cached
+        if claimed or time.monotonic() >= deadline:
+            break
+        time.sleep(PROMPT_CLAIM_POLL)
+    
+    generated_words = generate_words_by_prompt(prompt, count)
+    
+    conn = db.get_connection()
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    try:
+        if generated_words:
+            save_prompt_words(cursor, prompt_key, count, generated_words)
+        if claimed:
+            release_prompt_claim(cursor, prompt_key, count)
+        conn.commit()
+    finally:
+        cursor.close()
+        db.release_connection(conn)
+    return generated_words
+
+def stream_words_by_prompt(prompt: str, count: int = 15) -> Iterator[Dict[str, Any]]:
+    chunks = genapi.stream_chat(
+        f'На основе запроса пользователя: "{prompt}" - подбери {count} английских слов которые соответствуют этой теме. Для каждого слова дай русский перевод и 3 коротких примера использования на английском. Ответь ТОЛЬКО в формате JSON массива без дополнительного текста: [{{"word": "english_word", "translation": "русский перевод", "examples": ["Example 1", "Example 2", "Example 3"]}}]',
+        max_tokens=200 * count,
+        timeout=45
+    )
+    for word_data in genapi.iter_json_objects(chunks):
+        if isinstance(word_data, dict):
+            yield word_data
+
+def prepare_word_rows(generated_words: List[Dict[str, Any]]) -> List[Tuple[str, str, List[str], bool]]:
+    rows: Dict[str, Tuple[str, str, List[str], bool]] = {}
+    for word_data in generated_words:
+        if not isinstance(word_data, dict):
+            continue
+        
+        word_text = normalize_word(str(word_data.get('word') or ''))
+        if not word_text or word_text in rows:
+            continue
+        
+        translation = word_data.get('translation', 'перевод')
+        examples = word_data.get('examples', ['Пример 1', 'Пример 2', 'Пример 3'])
+        cacheable = bool(word_data.get('translation') and word_data.get('examples'))
+        rows[word_text] = (word_text, translation, examples, cacheable)
+    return list(rows.values())
+
+def insert_words_bulk(cursor, user_id: int, rows: List[Tuple[str, str, List[str], bool]]) -> List[Dict[str, Any]]:
+    if not rows:
+        return []
+    
+    cacheable = [(word, translation, examples) for word, translation, examples, ok in rows if ok]
+    if cacheable:
+        execute_values(
+            cursor,
+            """INSERT INTO t_p7147437_shag_to_speak.dictionary
+               (english_word, russian_translation, examples)
+               VALUES %s
+               ON CONFLICT (english_word) DO NOTHING""",
+            cacheable,
+            template='(%s, %s, %s::text[])',
+            page_size=len(cacheable)
+        )
+    
+    inserted = execute_values(
+        cursor,
+        """INSERT INTO t_p7147437_shag_to_speak.words 
+           (user_id, english_word, russian_translation, examples, status, recall_count)
+           VALUES %s
+           ON CONFLICT (user_id, english_word) DO NOTHING
+           RETURNING id, english_word, russian_translation, examples, status, recall_count""",
+        [(user_id, word, translation, examples) for word, translation, examples, _ in rows],
+        template="(%s, %s, %s, %s::text[], 'learning', 0)",
+        page_size=len(rows),
+        fetch=True
+    )
+    order = {row[0]: i for i, row in enumerate(rows)}
+    return [
+        {
+            'id': new_word['id'],
+            'english_word': new_word['english_word'],
+            'russian_translation': new_word['russian_translation'],
+            'examples': new_word['examples'],
+            'status': new_word['status'],
+            'recall_count': new_word['recall_count']
+        }
+        for new_word in sorted(inserted, key=lambda w: order.get(w['english_word'], 0))
+    ]
+
+def insert_generated_word(cursor, user_id: int, word_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    inserted = insert_words_bulk(cursor, user_id, prepare_word_rows([word_data]))
+    return inserted[0] if inserted else None
+
+def stream_added_words(conn, cursor, user_id: int, prompt: str, count: int) -> Iterator[str]:
+    prompt_key = normalize_prompt(prompt)
+    cached = get_cached_prompt_words(cursor, prompt_key, count)
+    source = cached if cached is not None else stream_words_by_prompt(prompt, count)
+    
+    generated_words = []
+    added = 0
+    completed = True
+    try:
+        for word_data in source:
+            if len(generated_words) >= count:
+                break
+            generated_words.append(word_data)
+            
+            new_word = insert_generated_word(cursor, user_id, word_data)
+            if not new_word:
+                continue
+            
+            conn.commit()
+            added += 1
+            yield json.dumps({'word': new_word}) + '\n'
+    except Exception:
+        completed = False
+    
+    if cached is None and completed and generated_words:
+        save_prompt_words(cursor, prompt_key, count, generated_words)
+        conn.commit()
+    
+    if not generated_words:
+        yield json.dumps({'error': 'Failed to generate words'}) + '\n'
+    yield json.dumps({'done': True, 'count': added, 'prompt': prompt}) + '\n'
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'POST')
     
@@ -110,12 +275,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'isBase64Encoded': False
         }
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    conn = db.get_connection()
     cursor = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
         cursor.execute(
-            "SELECT status FROM t_p7147437_shag_to_speak.users WHERE id = %s",
+            "SELECT status, word_count FROM t_p7147437_shag_to_speak.users WHERE id = %s",
             (user_id,)
         )
         user = cursor.fetchone()
@@ -128,11 +293,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'isBase64Encoded': False
             }
         
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM t_p7147437_shag_to_speak.words WHERE user_id = %s",
-            (user_id,)
-        )
-        current_count = cursor.fetchone()['count']
+        current_count = user['word_count']
         
         word_limit = 50 if user['status'] == 'free' else 999
         if current_count + count > word_limit:
@@ -143,7 +304,31 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'isBase64Encoded': False
             }
         
-        generated_words = generate_words_by_prompt(prompt, count)
+        if body_data.get('stream'):
+            lines = stream_added_words(conn, cursor, user_id, prompt, count)
+            stream_write = getattr(context, 'stream_write', None)
+            if stream_write:
+                for line in lines:
+                    stream_write(line)
+                body = ''
+            else:
+                body = ''.join(lines)
+            
+            return {
+                'statusCode': 200,
+                'headers': {'Content-Type': 'application/x-ndjson', 'Access-Control-Allow-Origin': '*'},
+                'body': body,
+                'isBase64Encoded': False
+            }
+        
+        conn.commit()
+        cursor.close()
+        db.release_connection(conn)
+        
+        generated_words = get_words_for_prompt(prompt, count)
+        
+        conn = db.get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
         
         if not generated_words:
             return {
@@ -153,31 +338,10 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'isBase64Encoded': False
             }
         
-        added_words = []
-        for word_data in generated_words:
-            word_text = word_data.get('word', '').strip().lower()
-            translation = word_data.get('translation', 'перевод')
-            examples = word_data.get('examples', ['Пример 1', 'Пример 2', 'Пример 3'])
-            
-            if not word_text:
-                continue
-            
-            cursor.execute(
-                """INSERT INTO t_p7147437_shag_to_speak.words 
-                   (user_id, english_word, russian_translation, examples, status, recall_count)
-                   VALUES (%s, %s, %s, %s, 'learning', 0)
-                   RETURNING id, english_word, russian_translation, examples, status, recall_count""",
-                (user_id, word_text, translation, examples)
-            )
-            new_word = cursor.fetchone()
-            added_words.append({
-                'id': new_word['id'],
-                'english_word': new_word['english_word'],
-                'russian_translation': new_word['russian_translation'],
-                'examples': new_word['examples'],
-                'status': new_word['status'],
-                'recall_count': new_word['recall_count']
-            })
+        rows = prepare_word_rows(generated_words)
+        added_words = insert_words_bulk(cursor, user_id, rows)
+        added_set = {w['english_word'] for w in added_words}
+        skipped = [row[0] for row in rows if row[0] not in added_set]
         
         conn.commit()
         
@@ -187,6 +351,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'body': json.dumps({
                 'words': added_words,
                 'count': len(added_words),
+                'skipped': skipped,
                 'prompt': prompt
             }),
             'isBase64Encoded': False
@@ -194,4 +359,4 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     finally:
         cursor.close()
-        conn.close()
+        db.release_connection(conn)
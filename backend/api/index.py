@@ -6,39 +6,65 @@ Returns: HTTP response с statusCode, headers, body
 
 import json
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Dict, Any, List
+from psycopg2.extras import execute_values
+from typing import Dict, Any, List, Optional
 import hashlib
-import requests
 from datetime import datetime, date
 
+import db
+import genapi
+import pagination
+
+PLACEHOLDER_TRANSLATION = 'перевод генерируется...'
+DICTIONARY_TTL_DAYS = int(os.environ.get('DICTIONARY_TTL_DAYS', '90'))
+ENRICHMENT_BATCH_SIZE = max(1, int(os.environ.get('ENRICHMENT_BATCH_SIZE', '10')))
+
 def get_db_connection():
-    dsn = os.environ.get('DATABASE_URL')
-    return psycopg2.connect(dsn, cursor_factory=RealDictCursor)
+    return db.get_connection()
 
 def hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
-def call_ai(prompt: str) -> str:
-    api_key = os.environ.get('GENAPI_KEY')
-    url = 'https://gen-api.ru/api/v1/chat/completions'
+def call_ai(prompt: str, max_tokens: int = 500) -> str:
+    return genapi.chat(prompt, max_tokens=max_tokens, timeout=30)
+
+def normalize_word(word: str) -> str:
+    return ' '.join(word.split()).lower()
+
+def get_cached_translation(cur, word: str) -> Optional[Dict[str, Any]]:
+    cur.execute(
+        """SELECT russian_translation, examples FROM dictionary
+           WHERE english_word = %s AND updated_at >= CURRENT_TIMESTAMP - make_interval(days => %s)""",
+        (normalize_word(word), DICTIONARY_TTL_DAYS)
+    )
+    return cur.fetchone()
+
+def save_cached_translation(cur, word: str, russian_translation: str, examples: List[str]) -> None:
+    cur.execute(
+        """INSERT INTO dictionary (english_word, russian_translation, examples) VALUES (%s, %s, %s)
+           ON CONFLICT (english_word) DO UPDATE
+           SET russian_translation = EXCLUDED.russian_translation, examples = EXCLUDED.examples, updated_at = CURRENT_TIMESTAMP""",
+        (normalize_word(word), russian_translation, examples)
+    )
+
+def translate_with_examples(cur, word: str) -> Dict[str, Any]:
+    cached = get_cached_translation(cur, word)
+    if cached:
+        return {'russian_translation': cached['russian_translation'], 'examples': cached['examples'] or []}
     
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
+    try:
+        prompt_translate = f"Translate this English word or phrase to Russian (only translation, no explanation): {word}"
+        russian_translation = call_ai(prompt_translate)
+        
+        prompt_examples = f"Generate 3 example sentences using the word '{word}' in English. Return only sentences, one per line."
+        examples_text = call_ai(prompt_examples)
+    except genapi.GenAPIError:
+        return {'russian_translation': PLACEHOLDER_TRANSLATION, 'examples': []}
     
-    payload = {
-        'model': 'o1-mini',
-        'messages': [{'role': 'user', 'content': prompt}],
-        'max_tokens': 500
-    }
+    examples = [ex.strip() for ex in examples_text.split('\n') if ex.strip()][:3]
     
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
-    response.raise_for_status()
-    result = response.json()
-    return result['choices'][0]['message']['content'].strip()
+    save_cached_translation(cur, word, russian_translation, examples)
+    return {'russian_translation': russian_translation, 'examples': examples}
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
@@ -103,6 +129,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'body': json.dumps({'error': str(e)}),
             'isBase64Encoded': False
         }
+    
+    finally:
+        db.release_all()
 
 def register_user(event: Dict[str, Any]) -> Dict[str, Any]:
     body_data = json.loads(event.get('body', '{}'))
@@ -124,7 +153,7 @@ def register_user(event: Dict[str, Any]) -> Dict[str, Any]:
     
     conn.commit()
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     return {
         'statusCode': 200,
@@ -150,7 +179,7 @@ def login_user(event: Dict[str, Any]) -> Dict[str, Any]:
     user = cur.fetchone()
     
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     if not user:
         return {
@@ -174,19 +203,15 @@ def get_user_info(event: Dict[str, Any]) -> Dict[str, Any]:
     cur = conn.cursor()
     
     cur.execute(
-        "SELECT id, email, name, status, preferences, daily_exercises_count, last_exercise_date FROM users WHERE id = %s",
+        "SELECT id, email, name, status, preferences, daily_exercises_count, last_exercise_date, word_count FROM users WHERE id = %s",
         (user_id,)
     )
     user = cur.fetchone()
     
-    cur.execute("SELECT COUNT(*) as count FROM words WHERE user_id = %s", (user_id,))
-    word_count = cur.fetchone()['count']
-    
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     user_data = dict(user)
-    user_data['word_count'] = word_count
     user_data['last_exercise_date'] = str(user_data['last_exercise_date']) if user_data['last_exercise_date'] else None
     
     today = date.today()
@@ -207,20 +232,19 @@ def add_word(event: Dict[str, Any]) -> Dict[str, Any]:
     user_id = event.get('headers', {}).get('x-user-id')
     body_data = json.loads(event.get('body', '{}'))
     
-    english_word = body_data.get('word').strip().lower()
+    english_word = normalize_word(body_data.get('word'))
     
     conn = get_db_connection()
     cur = conn.cursor()
     
-    cur.execute("SELECT COUNT(*) as count FROM words WHERE user_id = %s", (user_id,))
-    word_count = cur.fetchone()['count']
-    
-    cur.execute("SELECT status FROM users WHERE id = %s", (user_id,))
-    user_status = cur.fetchone()['status']
+    cur.execute("SELECT status, word_count FROM users WHERE id = %s", (user_id,))
+    user = cur.fetchone()
+    user_status = user['status']
+    word_count = user['word_count']
     
     if user_status == 'free' and word_count >= 50:
         cur.close()
-        conn.close()
+        db.release_connection(conn)
         return {
             'statusCode': 403,
             'headers': {'Access-Control-Allow-Origin': '*', 'Content-Type': 'application/json'},
@@ -228,22 +252,29 @@ def add_word(event: Dict[str, Any]) -> Dict[str, Any]:
             'isBase64Encoded': False
         }
     
-    prompt_translate = f"Translate this English word or phrase to Russian (only translation, no explanation): {english_word}"
-    russian_translation = call_ai(prompt_translate)
+    gen_data = translate_with_examples(cur, english_word)
+    russian_translation = gen_data['russian_translation']
+    examples = gen_data['examples']
     
-    prompt_examples = f"Generate 3 example sentences using the word '{english_word}' in English. Return only sentences, one per line."
-    examples_text = call_ai(prompt_examples)
-    examples = [ex.strip() for ex in examples_text.split('\n') if ex.strip()][:3]
+    enrichment_status = 'pending' if russian_translation == PLACEHOLDER_TRANSLATION else 'ready'
     
     cur.execute(
-        "INSERT INTO words (user_id, english_word, russian_translation, examples) VALUES (%s, %s, %s, %s) RETURNING id",
-        (user_id, english_word, russian_translation, examples)
+        """WITH inserted AS (
+               INSERT INTO words (user_id, english_word, russian_translation, examples, enrichment_status)
+               VALUES (%s, %s, %s, %s, %s)
+               RETURNING id, english_word, enrichment_status
+           ), queued AS (
+               INSERT INTO enrichment_jobs (word_id, english_word)
+               SELECT id, english_word FROM inserted WHERE enrichment_status = 'pending'
+           )
+           SELECT id FROM inserted""",
+        (user_id, english_word, russian_translation, examples, enrichment_status)
     )
     word_id = cur.fetchone()['id']
     
     conn.commit()
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     return {
         'statusCode': 200,
@@ -252,7 +283,8 @@ def add_word(event: Dict[str, Any]) -> Dict[str, Any]:
             'word_id': word_id,
             'english_word': english_word,
             'russian_translation': russian_translation,
-            'examples': examples
+            'examples': examples,
+            'enrichment_status': enrichment_status
         }),
         'isBase64Encoded': False
     }
@@ -262,23 +294,22 @@ def add_words_batch(event: Dict[str, Any]) -> Dict[str, Any]:
     body_data = json.loads(event.get('body', '{}'))
     
     words_text = body_data.get('words', '')
-    words_list = [w.strip().lower() for w in words_text.split(',') if w.strip()]
+    words_list = list(dict.fromkeys(normalize_word(w) for w in words_text.split(',') if w.strip()))
     
     conn = get_db_connection()
     cur = conn.cursor()
     
-    cur.execute("SELECT COUNT(*) as count FROM words WHERE user_id = %s", (user_id,))
-    word_count = cur.fetchone()['count']
-    
-    cur.execute("SELECT status FROM users WHERE id = %s", (user_id,))
-    user_status = cur.fetchone()['status']
+    cur.execute("SELECT status, word_count FROM users WHERE id = %s", (user_id,))
+    user = cur.fetchone()
+    user_status = user['status']
+    word_count = user['word_count']
     
     max_words = 50 if user_status == 'free' else 999999
     available_slots = max_words - word_count
     
     if len(words_list) > available_slots:
         cur.close()
-        conn.close()
+        db.release_connection(conn)
         return {
             'statusCode': 403,
             'headers': {'Access-Control-Allow-Origin': '*', 'Content-Type': 'application/json'},
@@ -286,32 +317,50 @@ def add_words_batch(event: Dict[str, Any]) -> Dict[str, Any]:
             'isBase64Encoded': False
         }
     
-    added_count = 0
-    for word in words_list:
-        try:
-            prompt_translate = f"Translate this English word or phrase to Russian (only translation): {word}"
-            russian_translation = call_ai(prompt_translate)
-            
-            prompt_examples = f"Generate 3 example sentences using '{word}' in English. One per line."
-            examples_text = call_ai(prompt_examples)
-            examples = [ex.strip() for ex in examples_text.split('\n') if ex.strip()][:3]
-            
-            cur.execute(
-                "INSERT INTO words (user_id, english_word, russian_translation, examples) VALUES (%s, %s, %s, %s)",
-                (user_id, word, russian_translation, examples)
-            )
-            added_count += 1
-        except:
-            pass
+    cur.execute(
+        "SELECT english_word FROM words WHERE user_id = %s AND english_word = ANY(%s)",
+        (user_id, words_list)
+    )
+    existing_words = {row['english_word'] for row in cur.fetchall()}
+    new_words = [w for w in words_list if w not in existing_words]
+    
+    enriched = translate_batch_with_examples(cur, new_words) if new_words else {}
+    
+    rows = []
+    for word in new_words:
+        gen_data = enriched.get(word) or translate_with_examples(cur, word)
+        enrichment_status = 'pending' if gen_data['russian_translation'] == PLACEHOLDER_TRANSLATION else 'ready'
+        rows.append((user_id, word, gen_data['russian_translation'], gen_data['examples'], enrichment_status))
+    
+    inserted = []
+    if rows:
+        inserted = execute_values(
+            cur,
+            """WITH inserted AS (
+                   INSERT INTO words (user_id, english_word, russian_translation, examples, enrichment_status) VALUES %s
+                   ON CONFLICT (user_id, english_word) DO NOTHING
+                   RETURNING id, english_word, enrichment_status
+               ), queued AS (
+                   INSERT INTO enrichment_jobs (word_id, english_word)
+                   SELECT id, english_word FROM inserted WHERE enrichment_status = 'pending'
+               )
+               SELECT english_word FROM inserted""",
+            rows,
+            template='(%s, %s, %s, %s::text[], %s)',
+            page_size=len(rows),
+            fetch=True
+        )
+    added_set = {row['english_word'] for row in inserted}
+    skipped = [w for w in words_list if w not in added_set]
     
     conn.commit()
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     return {
         'statusCode': 200,
         'headers': {'Access-Control-Allow-Origin': '*', 'Content-Type': 'application/json'},
-        'body': json.dumps({'added': added_count}),
+        'body': json.dumps({'added': len(added_set), 'skipped': skipped}),
         'isBase64Encoded': False
     }
 
@@ -319,31 +368,40 @@ def get_words(event: Dict[str, Any]) -> Dict[str, Any]:
     user_id = event.get('headers', {}).get('x-user-id')
     params = event.get('queryStringParameters', {})
     status_filter = params.get('status', 'all')
-    page = int(params.get('page', 1))
-    limit = 10
-    offset = (page - 1) * limit
+    limit = pagination.page_size(params.get('limit'))
+    try:
+        after = pagination.decode_cursor(params.get('cursor'))
+    except pagination.InvalidCursor as e:
+        return {
+            'statusCode': 400,
+            'headers': {'Access-Control-Allow-Origin': '*', 'Content-Type': 'application/json'},
+            'body': json.dumps({'error': str(e)}),
+            'isBase64Encoded': False
+        }
+    after_created, after_id = after if after else (None, None)
     
     conn = get_db_connection()
     cur = conn.cursor()
     
-    if status_filter != 'all':
-        cur.execute(
-            "SELECT * FROM words WHERE user_id = %s AND status = %s ORDER BY created_at DESC LIMIT %s OFFSET %s",
-            (user_id, status_filter, limit, offset)
-        )
-    else:
-        cur.execute(
-            "SELECT * FROM words WHERE user_id = %s ORDER BY created_at DESC LIMIT %s OFFSET %s",
-            (user_id, limit, offset)
-        )
+    cur.execute(
+        """SELECT * FROM words
+           WHERE user_id = %s
+             AND (%s = 'all' OR status = %s)
+             AND (%s::timestamp IS NULL OR (created_at, id) < (%s, %s))
+           ORDER BY created_at DESC, id DESC
+           LIMIT %s""",
+        (user_id, status_filter, status_filter, after_created, after_created, after_id, limit + 1)
+    )
     
     words = cur.fetchall()
+    next_page = pagination.next_cursor(words, limit)
+    words = words[:limit]
     
-    cur.execute("SELECT COUNT(*) as count FROM words WHERE user_id = %s", (user_id,))
-    total = cur.fetchone()['count']
+    cur.execute("SELECT word_count FROM users WHERE id = %s", (user_id,))
+    total = cur.fetchone()['word_count']
     
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     words_list = [dict(w) for w in words]
     for w in words_list:
@@ -353,7 +411,7 @@ def get_words(event: Dict[str, Any]) -> Dict[str, Any]:
     return {
         'statusCode': 200,
         'headers': {'Access-Control-Allow-Origin': '*', 'Content-Type': 'application/json'},
-        'body': json.dumps({'words': words_list, 'total': total}),
+        'body': json.dumps({'words': words_list, 'total': total, 'next_cursor': next_page}),
         'isBase64Encoded': False
     }
 
@@ -374,7 +432,7 @@ def update_word_status(event: Dict[str, Any]) -> Dict[str, Any]:
     
     conn.commit()
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     return {
         'statusCode': 200,
@@ -395,7 +453,7 @@ def delete_word(event: Dict[str, Any]) -> Dict[str, Any]:
     
     conn.commit()
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     return {
         'statusCode': 200,
@@ -404,6 +462,47 @@ def delete_word(event: Dict[str, Any]) -> Dict[str, Any]:
         'isBase64Encoded': False
     }
 
+def translate_batch_with_examples(cur, words: List[str]) -> Dict[str, Dict[str, Any]]:
+    cur.execute(
+        """SELECT english_word, russian_translation, examples FROM dictionary
+           WHERE english_word = ANY(%s) AND updated_at >= CURRENT_TIMESTAMP - make_interval(days => %s)""",
+        (words, DICTIONARY_TTL_DAYS)
+    )
+    results = {
+        row['english_word']: {'russian_translation': row['russian_translation'], 'examples': row['examples'] or []}
+        for row in cur.fetchall()
+    }
+    
+    missing = [w for w in words if w not in results]
+    for i in range(0, len(missing), ENRICHMENT_BATCH_SIZE):
+        chunk = missing[i:i + ENRICHMENT_BATCH_SIZE]
+        prompt = (
+            f"Translate these English words or phrases to Russian and generate 3 example sentences in English for each: "
+            f"{json.dumps(chunk, ensure_ascii=False)}. Return only a JSON array with one object per word: "
+            '[{"word": "english_word", "translation": "russian translation", "examples": ["Example 1", "Example 2", "Example 3"]}]'
+        )
+        try:
+            content = call_ai(prompt, max_tokens=200 * len(chunk))
+        except genapi.GenAPIError:
+            break
+        
+        for item in genapi.parse_json_objects(content):
+            if not isinstance(item, dict) or not isinstance(item.get('word'), str):
+                continue
+            word = normalize_word(item['word'])
+            translation = item.get('translation')
+            examples = item.get('examples')
+            if word not in chunk or word in results or not isinstance(translation, str) or not translation.strip():
+                continue
+            if not isinstance(examples, list) or not examples:
+                continue
+            
+            examples = [str(ex).strip() for ex in examples][:3]
+            save_cached_translation(cur, word, translation.strip(), examples)
+            results[word] = {'russian_translation': translation.strip(), 'examples': examples}
+    
+    return results
+
 def complete_exercise(event: Dict[str, Any]) -> Dict[str, Any]:
     user_id = event.get('headers', {}).get('x-user-id')
     body_data = json.loads(event.get('body', '{}'))
@@ -413,10 +512,13 @@ def complete_exercise(event: Dict[str, Any]) -> Dict[str, Any]:
     conn = get_db_connection()
     cur = conn.cursor()
     
-    for word_id in word_ids:
+    if word_ids:
         cur.execute(
-            "UPDATE words SET recall_count = recall_count + 1, last_recall_date = CURRENT_TIMESTAMP WHERE id = %s AND user_id = %s",
-            (word_id, user_id)
+            """UPDATE words w
+               SET recall_count = w.recall_count + a.attempts, last_recall_date = CURRENT_TIMESTAMP
+               FROM (SELECT word_id, COUNT(*) AS attempts FROM unnest(%s::int[]) AS word_id GROUP BY word_id) a
+               WHERE w.id = a.word_id AND w.user_id = %s""",
+            ([int(w) for w in word_ids], user_id)
         )
     
     today = date.today()
@@ -427,7 +529,7 @@ def complete_exercise(event: Dict[str, Any]) -> Dict[str, Any]:
     
     conn.commit()
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     return {
         'statusCode': 200,
@@ -442,11 +544,10 @@ def get_stats(event: Dict[str, Any]) -> Dict[str, Any]:
     conn = get_db_connection()
     cur = conn.cursor()
     
-    cur.execute("SELECT COUNT(*) as count FROM words WHERE user_id = %s AND status = 'learning'", (user_id,))
-    learning_count = cur.fetchone()['count']
-    
-    cur.execute("SELECT COUNT(*) as count FROM words WHERE user_id = %s AND status = 'done'", (user_id,))
-    done_count = cur.fetchone()['count']
+    cur.execute("SELECT learning_count, done_count FROM users WHERE id = %s", (user_id,))
+    counters = cur.fetchone()
+    learning_count = counters['learning_count']
+    done_count = counters['done_count']
     
     total_count = learning_count + done_count
     percent_done = round((done_count / total_count * 100) if total_count > 0 else 0, 1)
@@ -462,7 +563,7 @@ def get_stats(event: Dict[str, Any]) -> Dict[str, Any]:
     last_recall_date = str(last_recall['last_recall_date']) if last_recall and last_recall['last_recall_date'] else None
     
     cur.close()
-    conn.close()
+    db.release_connection(conn)
     
     return {
         'statusCode': 200,
@@ -480,10 +581,21 @@ def get_stats(event: Dict[str, Any]) -> Dict[str, Any]:
 
 def generate_translation(event: Dict[str, Any]) -> Dict[str, Any]:
     body_data = json.loads(event.get('body', '{}'))
-    word = body_data.get('word', '')
+    word = normalize_word(body_data.get('word', ''))
     
-    prompt = f"Translate to Russian (only translation): {word}"
-    translation = call_ai(prompt)
+    conn = get_db_connection()
+    cur = conn.cursor()
+    cached = get_cached_translation(cur, word)
+    cur.close()
+    db.release_connection(conn)
+    
+    if cached:
+        translation = cached['russian_translation']
+    else:
+        try:
+            translation = call_ai(f"Translate to Russian (only translation): {word}")
+        except genapi.GenAPIError:
+            translation = PLACEHOLDER_TRANSLATION
     
     return {
         'statusCode': 200,
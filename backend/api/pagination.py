@@ -0,0 +1,43 @@
+"""
+Business: Keyset-пагинация по (created_at, id) с непрозрачным курсором
+Args: строка курсора из запроса или последняя строка страницы
+Returns: пара (created_at, id) для условия WHERE или закодированный курсор следующей страницы
+"""
+
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+PAGE_SIZE = int(os.environ.get('WORDS_PAGE_SIZE', '50'))
+MAX_PAGE_SIZE = int(os.environ.get('WORDS_MAX_PAGE_SIZE', '200'))
+
+class InvalidCursor(ValueError):
+    pass
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    payload = json.dumps([row['created_at'].isoformat(), row['id']], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidCursor('Invalid cursor')
+
+def page_size(value: Optional[str]) -> int:
+    try:
+        size = int(value) if value else PAGE_SIZE
+    except ValueError:
+        size = PAGE_SIZE
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+def next_cursor(rows: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    if len(rows) <= limit:
+        return None
+    return encode_cursor(rows[limit - 1])
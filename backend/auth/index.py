@@ -5,13 +5,13 @@ Returns: HTTP response с user_id, email, name, status, токеном
 """
 
 import json
-import os
 import hashlib
 import hmac
 from typing import Dict, Any
-import psycopg2
 from psycopg2.extras import RealDictCursor
 
+import db
+
 def hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
@@ -46,7 +46,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     body_data = json.loads(event.get('body', '{}'))
     action = body_data.get('action', 'login')
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    conn = db.get_connection()
     cursor = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
@@ -85,7 +85,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 """INSERT INTO t_p7147437_shag_to_speak.users 
                    (email, password_hash, name, phone, status, preferences, daily_exercises_count)
                    VALUES (%s, %s, %s, %s, 'free', %s, 0)
-                   RETURNING id, email, name, phone, status, preferences""",
+                   RETURNING id, email, name, phone, status, preferences, word_count""",
                 (email, password_hash, name, phone, preferences)
             )
             user = cursor.fetchone()
@@ -93,12 +93,6 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             
             token = create_token(user['id'], user['email'])
             
-            cursor.execute(
-                "SELECT COUNT(*) as word_count FROM t_p7147437_shag_to_speak.words WHERE user_id = %s",
-                (user['id'],)
-            )
-            word_count = cursor.fetchone()['word_count']
-            
             return {
                 'statusCode': 200,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
@@ -110,7 +104,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         'phone': user['phone'],
                         'status': user['status'],
                         'preferences': user['preferences'] or [],
-                        'word_count': word_count,
+                        'word_count': user['word_count'],
                         'exercises_remaining': 3,
                         'daily_exercises_count': 0
                     },
@@ -134,7 +128,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             password_hash = hash_password(password)
             
             cursor.execute(
-                """SELECT id, email, name, phone, status, preferences, daily_exercises_count, last_exercise_date
+                """SELECT id, email, name, phone, status, preferences, daily_exercises_count, last_exercise_date,
+                          word_count
                    FROM t_p7147437_shag_to_speak.users 
                    WHERE email = %s AND password_hash = %s""",
                 (email, password_hash)
@@ -149,12 +144,6 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'isBase64Encoded': False
                 }
             
-            cursor.execute(
-                "SELECT COUNT(*) as word_count FROM t_p7147437_shag_to_speak.words WHERE user_id = %s",
-                (user['id'],)
-            )
-            word_count = cursor.fetchone()['word_count']
-            
             daily_count = user['daily_exercises_count'] or 0
             exercises_remaining = 3 if user['status'] == 'free' else 999
             if user['status'] == 'free':
@@ -173,7 +162,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         'phone': user['phone'],
                         'status': user['status'],
                         'preferences': user['preferences'] or [],
-                        'word_count': word_count,
+                        'word_count': user['word_count'],
                         'exercises_remaining': exercises_remaining,
                         'daily_exercises_count': daily_count
                     },
@@ -192,4 +181,4 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     finally:
         cursor.close()
-        conn.close()
+        db.release_connection(conn)
@@ -0,0 +1,105 @@
+"""
+Business: Пул соединений с БД, переживающий тёплые вызовы функции
+Args: DATABASE_URL, DB_POOL_MIN, DB_POOL_MAX, DB_POOL_TIMEOUT, DB_HEALTHCHECK_INTERVAL в окружении
+Returns: проверенное соединение из пула; безопасно за PgBouncer в transaction mode
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+import psycopg2
+from psycopg2 import extensions, pool as pg_pool
+from psycopg2.extras import RealDictCursor
+
+DB_POOL_MIN = int(os.environ.get('DB_POOL_MIN', '1'))
+DB_POOL_MAX = int(os.environ.get('DB_POOL_MAX', '5'))
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+DB_HEALTHCHECK_INTERVAL = float(os.environ.get('DB_HEALTHCHECK_INTERVAL', '30'))
+
+_pool: Optional[pg_pool.ThreadedConnectionPool] = None
+_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+_last_used: Dict[int, float] = {}
+_local = threading.local()
+
+def get_pool() -> pg_pool.ThreadedConnectionPool:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = pg_pool.ThreadedConnectionPool(
+                DB_POOL_MIN,
+                DB_POOL_MAX,
+                os.environ['DATABASE_URL'],
+                cursor_factory=RealDictCursor
+            )
+        return _pool
+
+def is_healthy(conn) -> bool:
+    if conn.closed:
+        return False
+    if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+        return False
+    last_used = _last_used.get(id(conn))
+    if last_used is None or time.monotonic() - last_used < DB_HEALTHCHECK_INTERVAL:
+        return True
+    
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+def get_connection():
+    if not _slots.acquire(timeout=DB_POOL_TIMEOUT):
+        raise pg_pool.PoolError('Database connection pool exhausted')
+    
+    try:
+        db_pool = get_pool()
+        for _ in range(DB_POOL_MAX + 1):
+            conn = db_pool.getconn()
+            if is_healthy(conn):
+                break
+            _last_used.pop(id(conn), None)
+            db_pool.putconn(conn, close=True)
+        else:
+            raise pg_pool.PoolError('No healthy database connection available')
+    except Exception:
+        _slots.release()
+        raise
+    
+    conn.autocommit = False
+    checked_out = getattr(_local, 'checked_out', None)
+    if checked_out is None:
+        checked_out = _local.checked_out = []
+    checked_out.append(conn)
+    return conn
+
+def release_connection(conn) -> None:
+    checked_out = getattr(_local, 'checked_out', [])
+    if conn not in checked_out:
+        return
+    checked_out.remove(conn)
+    
+    broken = bool(conn.closed)
+    if not broken and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            broken = True
+    
+    if broken:
+        _last_used.pop(id(conn), None)
+    else:
+        _last_used[id(conn)] = time.monotonic()
+    
+    try:
+        get_pool().putconn(conn, close=broken)
+    finally:
+        _slots.release()
+
+def release_all() -> None:
+    for conn in list(getattr(_local, 'checked_out', [])):
+        release_connection(conn)
@@ -7,11 +7,233 @@ Returns: HTTP response с упражнениями или результатом
 import json
 import os
 import random
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import date, datetime
-import psycopg2
 from psycopg2.extras import RealDictCursor
 
+import db
+import session_token
+
+EXERCISE_WORDS = 5
+DISTRACTORS_PER_ITEM = 3
+DISTRACTOR_POOL = 20
+SM2_INITIAL_EASE = 2.5
+SM2_MIN_EASE = 1.3
+SM2_CORRECT_QUALITY = 4
+SM2_INCORRECT_QUALITY = 1
+LEARNED_MIN_RECALLS = 8
+LEARNED_MIN_SUCCESS_RATE = 0.8
+LEARNED_MIN_AGE_DAYS = 3
+LEARNED_MIN_REST_HOURS = 24
+SESSION_TTL = int(os.environ.get('EXERCISE_SESSION_TTL', '21600'))
+ANSWER_MAX_TYPOS = int(os.environ.get('EXERCISE_ANSWER_MAX_TYPOS', '0'))
+ANSWER_TYPO_MIN_LENGTH = int(os.environ.get('EXERCISE_ANSWER_TYPO_MIN_LENGTH', '5'))
+ANSWER_SEPARATORS = re.compile(r'[\s.,;:!?"\'«»„“”()\[\]{}…—–/\\]+')
+
+def normalize_answer(text: str) -> str:
+    return ANSWER_SEPARATORS.sub(' ', text.lower().replace('ё', 'е')).strip()
+
+def within_typos(answer: str, variant: str, max_typos: int) -> bool:
+    if abs(len(answer) - len(variant)) > max_typos:
+        return False
+    previous = list(range(len(variant) + 1))
+    for i, a in enumerate(answer, 1):
+        current = [i]
+        for j, v in enumerate(variant, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a != v)))
+        if min(current) > max_typos:
+            return False
+        previous = current
+    return previous[-1] <= max_typos
+
+def is_accepted(answer: str, accepted: frozenset, exercise_type: str) -> bool:
+    if answer in accepted:
+        return True
+    if exercise_type != 'translation' or ANSWER_MAX_TYPOS <= 0 or len(answer) < ANSWER_TYPO_MIN_LENGTH:
+        return False
+    return any(within_typos(answer, variant, ANSWER_MAX_TYPOS) for variant in accepted)
+
+def make_rng(seed: Optional[str]) -> random.Random:
+    if seed is None or seed == '':
+        return random.Random()
+    return random.Random(seed)
+
+def sample_exercise_words(cursor, user_id: int, rng: random.Random) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    cursor.execute(
+        """WITH due AS (
+               SELECT w.id, w.english_word, w.russian_translation, w.examples, w.accepted_answers,
+                      0 AS tier, row_number() OVER (ORDER BY p.next_review) AS rank
+               FROM (
+                   SELECT word_id, next_review
+                   FROM t_p7147437_shag_to_speak.word_progress
+                   WHERE user_id = %(user_id)s AND next_review IS NOT NULL AND next_review <= CURRENT_TIMESTAMP
+                   ORDER BY next_review
+                   LIMIT %(count)s
+               ) p
+               JOIN t_p7147437_shag_to_speak.words w ON w.id = p.word_id AND w.status = 'learning'
+           ),
+           fresh AS (
+               SELECT id, english_word, russian_translation, examples, accepted_answers,
+                      1 AS tier, row_number() OVER (ORDER BY lap, sample_key) AS rank
+               FROM (
+                   (SELECT id, english_word, russian_translation, examples, accepted_answers, 0 AS lap, sample_key
+                    FROM t_p7147437_shag_to_speak.words w
+                    WHERE user_id = %(user_id)s AND status = 'learning' AND sample_key >= %(target_key)s
+                      AND NOT EXISTS (
+                          SELECT 1 FROM t_p7147437_shag_to_speak.word_progress p
+                          WHERE p.user_id = w.user_id AND p.word_id = w.id AND p.next_review > CURRENT_TIMESTAMP
+                      )
+                    ORDER BY sample_key
+                    LIMIT %(count)s)
+                   UNION ALL
+                   (SELECT id, english_word, russian_translation, examples, accepted_answers, 1 AS lap, sample_key
+                    FROM t_p7147437_shag_to_speak.words w
+                    WHERE user_id = %(user_id)s AND status = 'learning' AND sample_key < %(target_key)s
+                      AND NOT EXISTS (
+                          SELECT 1 FROM t_p7147437_shag_to_speak.word_progress p
+                          WHERE p.user_id = w.user_id AND p.word_id = w.id AND p.next_review > CURRENT_TIMESTAMP
+                      )
+                    ORDER BY sample_key
+                    LIMIT %(count)s)
+               ) f
+           ),
+           early AS (
+               SELECT id, english_word, russian_translation, examples, accepted_answers,
+                      2 AS tier, row_number() OVER (ORDER BY lap, sample_key) AS rank
+               FROM (
+                   (SELECT id, english_word, russian_translation, examples, accepted_answers, 0 AS lap, sample_key
+                    FROM t_p7147437_shag_to_speak.words
+                    WHERE user_id = %(user_id)s AND status = 'learning' AND sample_key >= %(target_key)s
+                    ORDER BY sample_key
+                    LIMIT %(count)s)
+                   UNION ALL
+                   (SELECT id, english_word, russian_translation, examples, accepted_answers, 1 AS lap, sample_key
+                    FROM t_p7147437_shag_to_speak.words
+                    WHERE user_id = %(user_id)s AND status = 'learning' AND sample_key < %(target_key)s
+                    ORDER BY sample_key
+                    LIMIT %(count)s)
+               ) e
+           ),
+           targets AS (
+               SELECT id, english_word, russian_translation, examples, accepted_answers
+               FROM (
+                   SELECT DISTINCT ON (id) id, english_word, russian_translation, examples, accepted_answers, tier, rank
+                   FROM (
+                       SELECT * FROM due
+                       UNION ALL
+                       SELECT * FROM fresh
+                       UNION ALL
+                       SELECT * FROM early
+                   ) candidates
+                   ORDER BY id, tier, rank
+               ) t
+               ORDER BY tier, rank
+               LIMIT %(count)s
+           ),
+           distractors AS (
+               SELECT id, russian_translation
+               FROM (
+                   (SELECT id, russian_translation, 0 AS lap, sample_key
+                    FROM t_p7147437_shag_to_speak.words
+                    WHERE user_id = %(user_id)s AND sample_key >= %(distractor_key)s
+                    ORDER BY sample_key
+                    LIMIT %(pool)s)
+                   UNION ALL
+                   (SELECT id, russian_translation, 1 AS lap, sample_key
+                    FROM t_p7147437_shag_to_speak.words
+                    WHERE user_id = %(user_id)s AND sample_key < %(distractor_key)s
+                    ORDER BY sample_key
+                    LIMIT %(pool)s)
+               ) d
+               ORDER BY lap, sample_key
+               LIMIT %(pool)s
+           )
+           SELECT 'target' AS role, id, english_word, russian_translation, examples, accepted_answers FROM targets
+           UNION ALL
+           SELECT 'distractor' AS role, id, NULL, russian_translation, NULL, NULL FROM distractors""",
+        {
+            'user_id': user_id,
+            'count': EXERCISE_WORDS,
+            'target_key': rng.random(),
+            'distractor_key': rng.random(),
+            'pool': DISTRACTOR_POOL
+        }
+    )
+    rows = cursor.fetchall()
+    targets = [row for row in rows if row['role'] == 'target']
+    distractors = [row for row in rows if row['role'] == 'distractor']
+    rng.shuffle(targets)
+    return targets, distractors
+
+def next_schedule(state: Dict[str, Any], is_correct: bool) -> Dict[str, Any]:
+    quality = SM2_CORRECT_QUALITY if is_correct else SM2_INCORRECT_QUALITY
+    ease = state['ease_factor'] + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+    ease = max(SM2_MIN_EASE, ease)
+    
+    if not is_correct:
+        return {'ease_factor': ease, 'interval_days': 1.0, 'repetitions': 0}
+    
+    repetitions = state['repetitions'] + 1
+    if repetitions == 1:
+        interval = 1.0
+    elif repetitions == 2:
+        interval = 6.0
+    else:
+        interval = round(state['interval_days'] * state['ease_factor'])
+    return {'ease_factor': ease, 'interval_days': float(interval), 'repetitions': repetitions}
+
+def pick_distractors(word: Dict[str, Any], pool: List[Dict[str, Any]], rng: random.Random) -> List[str]:
+    candidates = list(dict.fromkeys(
+        row['russian_translation'] for row in pool
+        if row['id'] != word['id'] and row['russian_translation'] != word['russian_translation']
+    ))
+    return rng.sample(candidates, min(DISTRACTORS_PER_ITEM, len(candidates)))
+
+def build_exercises(cursor, user_id: int, rng: random.Random) -> List[Dict[str, Any]]:
+    words, distractor_pool = sample_exercise_words(cursor, user_id, rng)
+    
+    exercises = []
+    for word in words:
+        exercise_type = rng.choice(['translation', 'multiple_choice'])
+        
+        if exercise_type == 'translation':
+            exercises.append({
+                'word_id': word['id'],
+                'type': 'translation',
+                'question': word['english_word'],
+                'correct_answer': word['russian_translation'],
+                'accepted_answers': word['accepted_answers']
+            })
+        else:
+            wrong_answers = pick_distractors(word, distractor_pool + words, rng)
+            
+            options = [word['russian_translation']] + wrong_answers
+            rng.shuffle(options)
+            
+            exercises.append({
+                'word_id': word['id'],
+                'type': 'multiple_choice',
+                'question': word['english_word'],
+                'options': options,
+                'correct_answer': word['russian_translation'],
+                'accepted_answers': word['accepted_answers']
+            })
+    return exercises
+
+def store_session(cursor, user_id: int, exercises: List[Dict[str, Any]]) -> None:
+    cursor.execute(
+        """INSERT INTO t_p7147437_shag_to_speak.exercise_sessions (user_id, data_version, exercises, built_at)
+           SELECT id, data_version, %s::jsonb, CURRENT_TIMESTAMP
+           FROM t_p7147437_shag_to_speak.users
+           WHERE id = %s
+           ON CONFLICT (user_id) DO UPDATE
+           SET data_version = EXCLUDED.data_version,
+               exercises = EXCLUDED.exercises,
+               built_at = EXCLUDED.built_at""",
+        (json.dumps(exercises), user_id)
+    )
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
@@ -41,16 +263,27 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     user_id = int(user_id_str)
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    if not session_token.is_configured():
+        return {
+            'statusCode': 503,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Exercise sessions are not configured: EXERCISE_SESSION_SECRET is not set'}),
+            'isBase64Encoded': False
+        }
+    
+    conn = db.get_connection()
     cursor = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
         if method == 'GET':
             cursor.execute(
-                """SELECT status, daily_exercises_count, last_exercise_date 
-                   FROM t_p7147437_shag_to_speak.users 
-                   WHERE id = %s""",
-                (user_id,)
+                """SELECT u.status, u.daily_exercises_count, u.last_exercise_date, s.exercises
+                   FROM t_p7147437_shag_to_speak.users u
+                   LEFT JOIN t_p7147437_shag_to_speak.exercise_sessions s
+                     ON s.user_id = u.id AND s.data_version = u.data_version
+                    AND s.built_at > CURRENT_TIMESTAMP - make_interval(secs => %s)
+                   WHERE u.id = %s""",
+                (SESSION_TTL, user_id)
             )
             user = cursor.fetchone()
             
@@ -78,17 +311,17 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'isBase64Encoded': False
                 }
             
-            cursor.execute(
-                """SELECT id, english_word, russian_translation, examples
-                   FROM t_p7147437_shag_to_speak.words 
-                   WHERE user_id = %s AND status = 'learning'
-                   ORDER BY RANDOM()
-                   LIMIT 5""",
-                (user_id,)
-            )
-            words = cursor.fetchall()
+            seed = (event.get('queryStringParameters') or {}).get('seed')
+            if seed:
+                exercises = build_exercises(cursor, user_id, make_rng(seed))
+            elif user['exercises'] is not None:
+                exercises = user['exercises']
+            else:
+                exercises = build_exercises(cursor, user_id, make_rng(None))
+                store_session(cursor, user_id, exercises)
+                conn.commit()
             
-            if not words:
+            if not exercises:
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
@@ -96,44 +329,23 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'isBase64Encoded': False
                 }
             
-            exercises = []
-            for word in words:
-                exercise_type = random.choice(['translation', 'multiple_choice'])
-                
-                if exercise_type == 'translation':
-                    exercises.append({
-                        'word_id': word['id'],
-                        'type': 'translation',
-                        'question': word['english_word'],
-                        'correct_answer': word['russian_translation']
-                    })
-                else:
-                    cursor.execute(
-                        """SELECT russian_translation 
-                           FROM t_p7147437_shag_to_speak.words 
-                           WHERE user_id = %s AND id != %s
-                           ORDER BY RANDOM()
-                           LIMIT 3""",
-                        (user_id, word['id'])
-                    )
-                    wrong_answers = [w['russian_translation'] for w in cursor.fetchall()]
-                    
-                    options = [word['russian_translation']] + wrong_answers
-                    random.shuffle(options)
-                    
-                    exercises.append({
-                        'word_id': word['id'],
-                        'type': 'multiple_choice',
-                        'question': word['english_word'],
-                        'options': options,
-                        'correct_answer': word['russian_translation']
-                    })
-            
             return {
                 'statusCode': 200,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
                 'body': json.dumps({
-                    'exercises': exercises,
+                    'exercises': [
+                        {key: value for key, value in exercise.items() if key not in ('correct_answer', 'accepted_answers')}
+                        for exercise in exercises
+                    ],
+                    'session_token': session_token.sign(user_id, [
+                        [
+                            exercise['word_id'],
+                            exercise['correct_answer'],
+                            exercise.get('accepted_answers') or [normalize_answer(exercise['correct_answer'] or '')],
+                            exercise['type']
+                        ]
+                        for exercise in exercises
+                    ]),
                     'exercises_remaining': limit - daily_count - 1
                 }),
                 'isBase64Encoded': False
@@ -151,6 +363,19 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'isBase64Encoded': False
                 }
             
+            try:
+                expected = {
+                    word_id: (translation, frozenset(accepted), exercise_type)
+                    for word_id, (translation, accepted, exercise_type) in session_token.verify(body_data.get('session_token'), user_id).items()
+                }
+            except session_token.InvalidToken as e:
+                return {
+                    'statusCode': 400,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'error': str(e)}),
+                    'isBase64Encoded': False
+                }
+            
             cursor.execute(
                 """SELECT status, daily_exercises_count, last_exercise_date 
                    FROM t_p7147437_shag_to_speak.users 
@@ -166,57 +391,121 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             if last_date != today:
                 daily_count = 0
             
+            word_ids = list({
+                int(answer['word_id']) for answer in answers
+                if str(answer.get('word_id', '')).isdigit() and int(answer['word_id']) in expected
+            })
+            cursor.execute(
+                """SELECT word_id, ease_factor, interval_days, repetitions
+                   FROM t_p7147437_shag_to_speak.word_progress
+                   WHERE user_id = %s AND word_id = ANY(%s)""",
+                (user_id, word_ids)
+            )
+            initial = {'ease_factor': SM2_INITIAL_EASE, 'interval_days': 0.0, 'repetitions': 0}
+            schedules = {word_id: initial for word_id in word_ids}
+            schedules.update({row['word_id']: row for row in cursor.fetchall()})
+            
             results = []
+            graded_ids = []
+            graded_correct = []
+            graded_answers = []
             correct_count = 0
             
             for answer in answers:
                 word_id = answer.get('word_id')
-                user_answer = answer.get('answer', '').strip().lower()
+                translation, accepted, exercise_type = expected.get(int(word_id), (None, None, None)) if str(word_id).isdigit() else (None, None, None)
                 
-                cursor.execute(
-                    "SELECT russian_translation FROM t_p7147437_shag_to_speak.words WHERE id = %s",
-                    (word_id,)
-                )
-                word = cursor.fetchone()
-                
-                if not word:
+                if translation is None:
                     continue
                 
-                correct_answer = word['russian_translation'].strip().lower()
-                is_correct = user_answer == correct_answer
+                user_answer = normalize_answer(answer.get('answer', ''))
+                is_correct = is_accepted(user_answer, accepted, exercise_type)
                 
                 if is_correct:
                     correct_count += 1
                 
-                cursor.execute(
-                    """INSERT INTO t_p7147437_shag_to_speak.exercises 
-                       (user_id, word_id, exercise_type, is_correct, user_answer)
-                       VALUES (%s, %s, 'mixed', %s, %s)""",
-                    (user_id, word_id, is_correct, user_answer)
-                )
-                
-                cursor.execute(
-                    """UPDATE t_p7147437_shag_to_speak.words 
-                       SET recall_count = recall_count + 1,
-                           last_recall_date = CURRENT_TIMESTAMP
-                       WHERE id = %s""",
-                    (word_id,)
-                )
-                
+                graded_ids.append(int(word_id))
+                schedules[int(word_id)] = next_schedule(schedules[int(word_id)], is_correct)
+                graded_correct.append(is_correct)
+                graded_answers.append(user_answer)
                 results.append({
                     'word_id': word_id,
                     'is_correct': is_correct,
-                    'correct_answer': word['russian_translation']
+                    'correct_answer': translation
                 })
             
+            scheduled_ids = list(dict.fromkeys(graded_ids))
             cursor.execute(
-                """UPDATE t_p7147437_shag_to_speak.users 
-                   SET daily_exercises_count = %s,
-                       last_exercise_date = %s
-                   WHERE id = %s""",
-                (daily_count + 1, today, user_id)
+                """WITH graded AS (
+                       SELECT word_id, is_correct, user_answer
+                       FROM unnest(%s::int[], %s::boolean[], %s::text[]) AS a(word_id, is_correct, user_answer)
+                   ),
+                   attempted AS (
+                       SELECT g.word_id, COUNT(*) AS attempts,
+                              COUNT(*) FILTER (WHERE g.is_correct) AS correct
+                       FROM graded g
+                       GROUP BY g.word_id
+                   ),
+                   promoted AS (
+                       SELECT w.id
+                       FROM t_p7147437_shag_to_speak.words w
+                       JOIN attempted a ON a.word_id = w.id
+                       LEFT JOIN t_p7147437_shag_to_speak.word_progress p
+                         ON p.user_id = w.user_id AND p.word_id = w.id
+                       WHERE w.user_id = %s AND w.status = 'learning'
+                         AND w.recall_count + a.attempts >= %s
+                         AND COALESCE(p.correct_count, 0) + a.correct >= %s * (w.recall_count + a.attempts)
+                         AND w.created_at <= CURRENT_TIMESTAMP - make_interval(days => %s)
+                         AND (w.last_recall_date IS NULL
+                              OR w.last_recall_date <= CURRENT_TIMESTAMP - make_interval(hours => %s))
+                   ),
+                   recalled AS (
+                       UPDATE t_p7147437_shag_to_speak.words w
+                       SET recall_count = w.recall_count + a.attempts,
+                           last_recall_date = CURRENT_TIMESTAMP,
+                           sample_key = random(),
+                           status = CASE WHEN w.id IN (SELECT id FROM promoted) THEN 'done' ELSE w.status END
+                       FROM attempted a
+                       WHERE w.id = a.word_id AND w.user_id = %s
+                       RETURNING w.id
+                   ),
+                   inserted AS (
+                       INSERT INTO t_p7147437_shag_to_speak.exercises 
+                       (user_id, word_id, exercise_type, is_correct, user_answer)
+                       SELECT %s, word_id, 'mixed', is_correct, user_answer FROM graded
+                       WHERE word_id IN (SELECT id FROM recalled)
+                   ),
+                   scheduled AS (
+                       INSERT INTO t_p7147437_shag_to_speak.word_progress 
+                       (user_id, word_id, ease_factor, interval_days, repetitions, next_review)
+                       SELECT %s, word_id, ease_factor, interval_days, repetitions,
+                              CURRENT_TIMESTAMP + make_interval(days => interval_days::int)
+                       FROM unnest(%s::int[], %s::real[], %s::real[], %s::int[])
+                            AS s(word_id, ease_factor, interval_days, repetitions)
+                       WHERE word_id IN (SELECT id FROM recalled)
+                       ON CONFLICT (user_id, word_id) DO UPDATE
+                       SET ease_factor = EXCLUDED.ease_factor,
+                           interval_days = EXCLUDED.interval_days,
+                           repetitions = EXCLUDED.repetitions,
+                           next_review = EXCLUDED.next_review
+                   ),
+                   counted AS (
+                       UPDATE t_p7147437_shag_to_speak.users 
+                       SET daily_exercises_count = %s,
+                           last_exercise_date = %s
+                       WHERE id = %s
+                   )
+                   SELECT id FROM promoted""",
+                (graded_ids, graded_correct, graded_answers,
+                 user_id, LEARNED_MIN_RECALLS, LEARNED_MIN_SUCCESS_RATE, LEARNED_MIN_AGE_DAYS, LEARNED_MIN_REST_HOURS,
+                 user_id, user_id,
+                 user_id, scheduled_ids, [schedules[i]['ease_factor'] for i in scheduled_ids],
+                 [schedules[i]['interval_days'] for i in scheduled_ids], [schedules[i]['repetitions'] for i in scheduled_ids],
+                 daily_count + 1, today, user_id)
             )
+            learned_ids = [row['id'] for row in cursor.fetchall()]
             
+            store_session(cursor, user_id, build_exercises(cursor, user_id, make_rng(None)))
             conn.commit()
             
             limit = 999 if user['status'] == 'premium' else 3
@@ -228,6 +517,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'results': results,
                     'score': correct_count,
                     'total': len(answers),
+                    'learned_word_ids': learned_ids,
                     'exercises_remaining': max(0, limit - daily_count - 1)
                 }),
                 'isBase64Encoded': False
@@ -243,4 +533,4 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     finally:
         cursor.close()
-        conn.close()
+        db.release_connection(conn)
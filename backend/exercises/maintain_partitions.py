@@ -0,0 +1,39 @@
+"""
+Business: Обслуживание секций exercises - создание секций наперёд и перенос старых месяцев в архив
+Args: DATABASE_URL, EXERCISES_MONTHS_AHEAD и EXERCISES_KEEP_MONTHS в окружении; запускать по cron раз в сутки
+Returns: ничего, печатает число созданных и перенесённых в архив секций
+"""
+
+import os
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+MONTHS_AHEAD = int(os.environ.get('EXERCISES_MONTHS_AHEAD', '3'))
+KEEP_MONTHS = int(os.environ.get('EXERCISES_KEEP_MONTHS', '12'))
+
+def maintain(conn, months_ahead: int, keep_months: int) -> None:
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    try:
+        cursor.execute(
+            "SELECT t_p7147437_shag_to_speak.ensure_exercises_partitions(%s) as created",
+            (months_ahead,)
+        )
+        created = cursor.fetchone()['created']
+        conn.commit()
+        
+        cursor.execute(
+            "SELECT t_p7147437_shag_to_speak.archive_exercises_partitions(%s) as archived",
+            (keep_months,)
+        )
+        archived = cursor.fetchone()['archived']
+        conn.commit()
+    finally:
+        cursor.close()
+    print(f'created {created} partitions, archived {archived}')
+
+if __name__ == '__main__':
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        maintain(connection, MONTHS_AHEAD, KEEP_MONTHS)
+    finally:
+        connection.close()
@@ -0,0 +1,36 @@
+"""
+Business: Периодический перевод слов в выученные по правилу 8+ повторений, 80% верных, 3+ дня, 24+ часа с последнего повтора
+Args: DATABASE_URL и LEARNED_SWEEP_BATCH в окружении; запускать по cron
+Returns: ничего, печатает количество переведённых слов
+"""
+
+import os
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+BATCH_SIZE = int(os.environ.get('LEARNED_SWEEP_BATCH', '1000'))
+
+def sweep(conn, batch_size: int) -> int:
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    total = 0
+    try:
+        while True:
+            cursor.execute(
+                "SELECT t_p7147437_shag_to_speak.promote_learned_words(%s) as promoted",
+                (batch_size,)
+            )
+            promoted = cursor.fetchone()['promoted']
+            conn.commit()
+            total += promoted
+            if promoted < batch_size:
+                break
+    finally:
+        cursor.close()
+    return total
+
+if __name__ == '__main__':
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        print(f'promoted {sweep(connection, BATCH_SIZE)} words')
+    finally:
+        connection.close()
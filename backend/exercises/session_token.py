@@ -0,0 +1,52 @@
+"""
+Business: Зашифрованный токен сессии упражнений (AES-GCM) с ожидаемыми ответами и сроком действия
+Args: EXERCISE_SESSION_SECRET и EXERCISE_TOKEN_TTL в окружении; id пользователя и ответы сессии
+Returns: непрозрачный для клиента токен или расшифрованные ответы сессии; InvalidToken при подделке, чужом пользователе или истечении срока
+"""
+
+import base64
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+SESSION_SECRET = os.environ.get('EXERCISE_SESSION_SECRET', '')
+TOKEN_TTL = int(os.environ.get('EXERCISE_TOKEN_TTL', '3600'))
+NONCE_SIZE = 12
+
+class InvalidToken(ValueError):
+    pass
+
+def is_configured() -> bool:
+    return bool(SESSION_SECRET)
+
+def get_cipher() -> AESGCM:
+    return AESGCM(hashlib.sha256(SESSION_SECRET.encode()).digest())
+
+def sign(user_id: int, items: List[List[Any]]) -> str:
+    payload = json.dumps(
+        {'x': int(time.time()) + TOKEN_TTL, 'w': items},
+        ensure_ascii=False,
+        separators=(',', ':')
+    ).encode()
+    nonce = os.urandom(NONCE_SIZE)
+    sealed = nonce + get_cipher().encrypt(nonce, payload, str(user_id).encode())
+    return base64.urlsafe_b64encode(sealed).decode().rstrip('=')
+
+def verify(token: Any, user_id: int) -> Dict[int, List[Any]]:
+    if not isinstance(token, str) or not token:
+        raise InvalidToken('Invalid session token')
+    
+    try:
+        sealed = base64.urlsafe_b64decode((token + '=' * (-len(token) % 4)).encode())
+        payload = get_cipher().decrypt(sealed[:NONCE_SIZE], sealed[NONCE_SIZE:], str(user_id).encode())
+    except (ValueError, InvalidTag):
+        raise InvalidToken('Invalid session token')
+    
+    data = json.loads(payload)
+    if data['x'] < time.time():
+        raise InvalidToken('Session token expired')
+    return {int(item[0]): item[1:] for item in data['w']}
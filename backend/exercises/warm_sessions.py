@@ -0,0 +1,45 @@
+"""
+Business: Фоновый прогрев сессий упражнений для недавно активных пользователей с устаревшей или отсутствующей сессией
+Args: DATABASE_URL, WARM_ACTIVE_DAYS и WARM_SESSIONS_BATCH в окружении; запускать по cron
+Returns: ничего, печатает количество собранных сессий
+"""
+
+import os
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+from index import SESSION_TTL, build_exercises, make_rng, store_session
+
+ACTIVE_DAYS = int(os.environ.get('WARM_ACTIVE_DAYS', '7'))
+BATCH_SIZE = int(os.environ.get('WARM_SESSIONS_BATCH', '500'))
+
+def warm(conn, active_days: int, batch_size: int) -> int:
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    try:
+        cursor.execute(
+            """SELECT u.id
+               FROM t_p7147437_shag_to_speak.users u
+               LEFT JOIN t_p7147437_shag_to_speak.exercise_sessions s ON s.user_id = u.id
+               WHERE u.last_exercise_date >= CURRENT_DATE - %s
+                 AND (s.user_id IS NULL
+                      OR s.data_version <> u.data_version
+                      OR s.built_at <= CURRENT_TIMESTAMP - make_interval(secs => %s))
+               ORDER BY u.id
+               LIMIT %s""",
+            (active_days, SESSION_TTL, batch_size)
+        )
+        user_ids = [row['id'] for row in cursor.fetchall()]
+        
+        for user_id in user_ids:
+            store_session(cursor, user_id, build_exercises(cursor, user_id, make_rng(None)))
+            conn.commit()
+    finally:
+        cursor.close()
+    return len(user_ids)
+
+if __name__ == '__main__':
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        print(f'warmed {warm(connection, ACTIVE_DAYS, BATCH_SIZE)} sessions')
+    finally:
+        connection.close()
@@ -5,12 +5,13 @@ Returns: HTTP response со статистикой пользователя
 """
 
 import json
-import os
 from typing import Dict, Any
-from datetime import datetime, timedelta
-import psycopg2
+from datetime import date, datetime, timedelta
 from psycopg2.extras import RealDictCursor
 
+import db
+import response_cache
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
@@ -20,7 +21,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'headers': {
                 'Access-Control-Allow-Origin': '*',
                 'Access-Control-Allow-Methods': 'GET, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, X-User-Id, X-Auth-Token',
+                'Access-Control-Allow-Headers': 'Content-Type, X-User-Id, X-Auth-Token, If-None-Match',
                 'Access-Control-Max-Age': '86400'
             },
             'body': '',
@@ -48,67 +49,63 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     user_id = int(user_id_str)
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    conn = db.get_connection()
     cursor = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        cursor.execute(
-            """SELECT COUNT(*) as total, 
-                      SUM(CASE WHEN status = 'learning' THEN 1 ELSE 0 END) as learning,
-                      SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END) as done
-               FROM t_p7147437_shag_to_speak.words 
-               WHERE user_id = %s""",
-            (user_id,)
-        )
-        words_stats = cursor.fetchone()
+        version = response_cache.get_data_version(cursor, user_id)
+        today = date.today()
+        etag = response_cache.make_etag(user_id, version, today.isoformat())
+        if response_cache.is_not_modified(headers, etag):
+            return response_cache.not_modified_response(etag)
+        
+        cache_key = ('stats', user_id, version, today)
+        cached_body = response_cache.get_body(cache_key)
+        if cached_body is not None:
+            return response_cache.json_response(cached_body, etag)
         
         cursor.execute(
-            """SELECT COUNT(*) as total_exercises,
-                      SUM(CASE WHEN is_correct THEN 1 ELSE 0 END) as correct_count
-               FROM t_p7147437_shag_to_speak.exercises 
-               WHERE user_id = %s""",
+            """SELECT word_count as total, learning_count as learning, done_count as done, created_at,
+                      exercises_total, exercises_correct
+               FROM t_p7147437_shag_to_speak.users 
+               WHERE id = %s""",
             (user_id,)
         )
-        exercise_stats = cursor.fetchone()
+        user_stats = cursor.fetchone() or {
+            'total': 0, 'learning': 0, 'done': 0, 'created_at': None,
+            'exercises_total': 0, 'exercises_correct': 0
+        }
         
-        seven_days_ago = datetime.now() - timedelta(days=7)
+        seven_days_ago = (datetime.now() - timedelta(days=7)).date()
         cursor.execute(
-            """SELECT DATE(created_at) as date, COUNT(*) as count
-               FROM t_p7147437_shag_to_speak.exercises
-               WHERE user_id = %s AND created_at >= %s
-               GROUP BY DATE(created_at)
-               ORDER BY date""",
+            """SELECT day as date, exercise_count as count
+               FROM t_p7147437_shag_to_speak.user_daily_activity
+               WHERE user_id = %s AND day >= %s
+               ORDER BY day""",
             (user_id, seven_days_ago)
         )
         weekly_activity = cursor.fetchall()
         
         cursor.execute(
             """SELECT w.english_word, w.russian_translation, w.recall_count,
-                      COUNT(e.id) as total_attempts,
-                      SUM(CASE WHEN e.is_correct THEN 1 ELSE 0 END) as correct_attempts
-               FROM t_p7147437_shag_to_speak.words w
-               LEFT JOIN t_p7147437_shag_to_speak.exercises e ON w.id = e.word_id
-               WHERE w.user_id = %s
-               GROUP BY w.id, w.english_word, w.russian_translation, w.recall_count
-               ORDER BY correct_attempts DESC, total_attempts DESC
+                      p.total_count as total_attempts,
+                      p.correct_count as correct_attempts
+               FROM t_p7147437_shag_to_speak.word_progress p
+               JOIN t_p7147437_shag_to_speak.words w ON w.id = p.word_id
+               WHERE p.user_id = %s
+               ORDER BY p.correct_count DESC, p.total_count DESC
                LIMIT 10""",
             (user_id,)
         )
         top_words = cursor.fetchall()
         
-        cursor.execute(
-            "SELECT created_at FROM t_p7147437_shag_to_speak.users WHERE id = %s",
-            (user_id,)
-        )
-        user_created = cursor.fetchone()
-        
         days_active = 0
-        if user_created and user_created['created_at']:
-            delta = datetime.now() - user_created['created_at']
+        if user_stats['created_at']:
+            delta = datetime.now() - user_stats['created_at']
             days_active = delta.days + 1
         
-        total_exercises = exercise_stats['total_exercises'] or 0
-        correct_count = exercise_stats['correct_count'] or 0
+        total_exercises = user_stats['exercises_total'] or 0
+        correct_count = user_stats['exercises_correct'] or 0
         accuracy = round((correct_count / total_exercises * 100), 1) if total_exercises > 0 else 0
         
         activity_data = []
@@ -131,29 +128,27 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'accuracy': word_accuracy
             })
         
-        return {
-            'statusCode': 200,
-            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-            'body': json.dumps({
-                'words': {
-                    'total': words_stats['total'] or 0,
-                    'learning': words_stats['learning'] or 0,
-                    'done': words_stats['done'] or 0
-                },
-                'exercises': {
-                    'total': total_exercises,
-                    'correct': correct_count,
-                    'accuracy': accuracy
-                },
-                'activity': {
-                    'days_active': days_active,
-                    'weekly': activity_data
-                },
-                'top_words': top_words_data
-            }),
-            'isBase64Encoded': False
-        }
+        body = json.dumps({
+            'words': {
+                'total': user_stats['total'] or 0,
+                'learning': user_stats['learning'] or 0,
+                'done': user_stats['done'] or 0
+            },
+            'exercises': {
+                'total': total_exercises,
+                'correct': correct_count,
+                'accuracy': accuracy
+            },
+            'activity': {
+                'days_active': days_active,
+                'weekly': activity_data
+            },
+            'top_words': top_words_data
+        })
+        response_cache.put_body(cache_key, body)
+        
+        return response_cache.json_response(body, etag)
     
     finally:
         cursor.close()
-        conn.close()
+        db.release_connection(conn)
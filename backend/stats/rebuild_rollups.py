@@ -0,0 +1,33 @@
+"""
+Business: Пересборка сводок статистики (итоги, дневная активность, word_progress) из истории exercises
+Args: DATABASE_URL в окружении; python rebuild_rollups.py [user_id ...]
+Returns: ничего, печатает количество пересобранных пользователей
+"""
+
+import os
+import sys
+from typing import List
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+def rebuild(conn, user_ids: List[int]) -> int:
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    rebuilt = 0
+    try:
+        for user_id in user_ids or [None]:
+            cursor.execute(
+                "SELECT t_p7147437_shag_to_speak.rebuild_exercise_rollups(%s) as rebuilt",
+                (user_id,)
+            )
+            rebuilt += cursor.fetchone()['rebuilt']
+            conn.commit()
+    finally:
+        cursor.close()
+    return rebuilt
+
+if __name__ == '__main__':
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        print(f'rebuilt {rebuild(connection, [int(arg) for arg in sys.argv[1:]])} users')
+    finally:
+        connection.close()
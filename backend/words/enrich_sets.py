@@ -0,0 +1,69 @@
+"""
+Business: Офлайн-обогащение каталога наборов слов - заполняет перевод и примеры в word_set_entries
+Args: DATABASE_URL и GENAPI_KEY в окружении; python enrich_sets.py [set_id ...]
+Returns: ничего, печатает количество обогащённых слов
+"""
+
+import os
+import sys
+from typing import List
+import psycopg2
+from psycopg2.extras import RealDictCursor, execute_values
+
+from index import enrich_words, PLACEHOLDER_TRANSLATION
+
+CHUNK_SIZE = int(os.environ.get('WORD_SETS_ENRICH_CHUNK', '50'))
+
+def enrich_pending_entries(conn, set_ids: List[str]) -> int:
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    failed: List[str] = []
+    total = 0
+    try:
+        while True:
+            cursor.execute(
+                """SELECT DISTINCT english_word
+                   FROM t_p7147437_shag_to_speak.word_set_entries
+                   WHERE russian_translation IS NULL
+                     AND (cardinality(%s::varchar[]) = 0 OR set_id = ANY(%s::varchar[]))
+                     AND english_word <> ALL(%s::varchar[])
+                   LIMIT %s""",
+                (set_ids, set_ids, failed, CHUNK_SIZE)
+            )
+            words = [row['english_word'] for row in cursor.fetchall()]
+            if not words:
+                break
+            
+            enriched = enrich_words(cursor, words)
+            ready = [
+                (word, gen_data['translation'], gen_data['examples'])
+                for word, gen_data in enriched.items()
+                if gen_data['translation'] != PLACEHOLDER_TRANSLATION
+            ]
+            ready_words = {word for word, _, _ in ready}
+            failed.extend(w for w in words if w not in ready_words)
+            
+            if ready:
+                execute_values(
+                    cursor,
+                    """UPDATE t_p7147437_shag_to_speak.word_set_entries e
+                       SET russian_translation = v.russian_translation,
+                           examples = v.examples,
+                           enriched_at = CURRENT_TIMESTAMP
+                       FROM (VALUES %s) AS v(english_word, russian_translation, examples)
+                       WHERE e.english_word = v.english_word AND e.russian_translation IS NULL""",
+                    ready,
+                    template='(%s, %s, %s::text[])'
+                )
+            conn.commit()
+            total += len(ready)
+            print(f'enriched {total} words, {len(failed)} failed')
+    finally:
+        cursor.close()
+    return total
+
+if __name__ == '__main__':
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        enrich_pending_entries(connection, sys.argv[1:])
+    finally:
+        connection.close()
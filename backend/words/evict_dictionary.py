@@ -0,0 +1,39 @@
+"""
+Business: Очистка общего кэша переводов dictionary - удаление устаревших записей или конкретных слов
+Args: DATABASE_URL и DICTIONARY_TTL_DAYS в окружении; python evict_dictionary.py [word ...]; без слов удаляет записи старше TTL
+Returns: ничего, печатает количество удалённых записей
+"""
+
+import os
+import sys
+from typing import List
+import psycopg2
+
+DICTIONARY_TTL_DAYS = int(os.environ.get('DICTIONARY_TTL_DAYS', '90'))
+
+def evict(conn, words: List[str], ttl_days: int) -> int:
+    cursor = conn.cursor()
+    try:
+        if words:
+            cursor.execute(
+                "DELETE FROM t_p7147437_shag_to_speak.dictionary WHERE english_word = ANY(%s)",
+                ([' '.join(word.split()).lower() for word in words],)
+            )
+        else:
+            cursor.execute(
+                """DELETE FROM t_p7147437_shag_to_speak.dictionary 
+                   WHERE updated_at < CURRENT_TIMESTAMP - make_interval(days => %s)""",
+                (ttl_days,)
+            )
+        evicted = cursor.rowcount
+        conn.commit()
+    finally:
+        cursor.close()
+    return evicted
+
+if __name__ == '__main__':
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        print(f'evicted {evict(connection, sys.argv[1:], DICTIONARY_TTL_DAYS)} dictionary entries')
+    finally:
+        connection.close()
@@ -0,0 +1,247 @@
+"""
+Business: Общий клиент GenAPI - keep-alive сессия, повторы с джиттером и circuit breaker
+Args: prompt и параметры запроса; GENAPI_KEY в окружении
+Returns: текст ответа модели или GenAPIError, если апстрим недоступен
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+GENAPI_BASE_URL = os.environ.get('GENAPI_BASE_URL', '').rstrip('/')
+NETWORK_URL = f"{GENAPI_BASE_URL or 'https://api.gen-api.ru'}/api/v1/networks/o1-mini"
+CHAT_URL = f"{GENAPI_BASE_URL or 'https://gen-api.ru'}/api/v1/chat/completions"
+
+MAX_RETRIES = int(os.environ.get('GENAPI_MAX_RETRIES', '2'))
+RETRY_BASE_DELAY = float(os.environ.get('GENAPI_RETRY_BASE_DELAY', '0.5'))
+BREAKER_THRESHOLD = int(os.environ.get('GENAPI_BREAKER_THRESHOLD', '5'))
+BREAKER_COOLDOWN = float(os.environ.get('GENAPI_BREAKER_COOLDOWN', '30'))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class GenAPIError(Exception):
+    pass
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+_consecutive_failures = 0
+_open_until = 0.0
+
+def get_session() -> requests.Session:
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+def is_available() -> bool:
+    return time.monotonic() >= _open_until
+
+def record_success() -> None:
+    global _consecutive_failures, _open_until
+    with _lock:
+        _consecutive_failures = 0
+        _open_until = 0.0
+
+def record_failure() -> None:
+    global _consecutive_failures, _open_until
+    with _lock:
+        _consecutive_failures += 1
+        if _consecutive_failures >= BREAKER_THRESHOLD:
+            _open_until = time.monotonic() + BREAKER_COOLDOWN
+
+def post(url: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    api_key = os.environ.get('GENAPI_KEY', '')
+    if not api_key:
+        raise GenAPIError('GENAPI_KEY is not configured')
+    if not is_available():
+        raise GenAPIError('GenAPI is temporarily unavailable')
+    
+    headers = {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+        'Authorization': f'Bearer {api_key}'
+    }
+    
+    last_error = 'GenAPI request failed'
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            time.sleep(random.uniform(0, RETRY_BASE_DELAY * 2 ** attempt))
+        
+        try:
+            response = get_session().post(url, headers=headers, json=payload, timeout=timeout)
+        except requests.Timeout:
+            last_error = 'GenAPI request timed out'
+            break
+        except requests.RequestException as e:
+            last_error = f'GenAPI connection error: {e}'
+            continue
+        
+        if response.status_code in RETRY_STATUSES:
+            last_error = f'GenAPI returned {response.status_code}'
+            continue
+        
+        if response.status_code != 200:
+            raise GenAPIError(f'GenAPI returned {response.status_code}')
+        
+        record_success()
+        return response.json()
+    
+    record_failure()
+    raise GenAPIError(last_error)
+
+def complete(prompt: str, timeout: float = 30) -> str:
+    data = post(
+        NETWORK_URL,
+        {
+            'is_sync': True,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'model': 'o1-mini-2024-09-12',
+            'stream': False,
+            'temperature': 1
+        },
+        timeout
+    )
+    try:
+        return data['output']['choices'][0]['message']['content'].strip()
+    except (KeyError, IndexError, TypeError):
+        raise GenAPIError('Unexpected GenAPI response')
+
+def chat(prompt: str, max_tokens: int = 500, timeout: float = 30) -> str:
+    data = post(
+        CHAT_URL,
+        {
+            'model': 'o1-mini',
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': max_tokens
+        },
+        timeout
+    )
+    try:
+        return data['choices'][0]['message']['content'].strip()
+    except (KeyError, IndexError, TypeError):
+        raise GenAPIError('Unexpected GenAPI response')
+
+def stream_chat(prompt: str, max_tokens: int = 2000, timeout: float = 45) -> Iterator[str]:
+    api_key = os.environ.get('GENAPI_KEY', '')
+    if not api_key:
+        raise GenAPIError('GENAPI_KEY is not configured')
+    if not is_available():
+        raise GenAPIError('GenAPI is temporarily unavailable')
+    
+    try:
+        response = get_session().post(
+            CHAT_URL,
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'text/event-stream',
+                'Authorization': f'Bearer {api_key}'
+            },
+            json={
+                'model': 'o1-mini',
+                'messages': [{'role': 'user', 'content': prompt}],
+                'max_tokens': max_tokens,
+                'stream': True
+            },
+            timeout=timeout,
+            stream=True
+        )
+    except requests.RequestException as e:
+        record_failure()
+        raise GenAPIError(f'GenAPI connection error: {e}')
+    
+    with response:
+        if response.status_code != 200:
+            if response.status_code in RETRY_STATUSES:
+                record_failure()
+            raise GenAPIError(f'GenAPI returned {response.status_code}')
+        
+        record_success()
+        response.encoding = 'utf-8'
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith('data:'):
+                continue
+            data = line[5:].strip()
+            if data == '[DONE]':
+                break
+            try:
+                delta = json.loads(data)['choices'][0]['delta'].get('content')
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                continue
+            if delta:
+                yield delta
+
+def iter_json_objects(chunks: Iterable[str]) -> Iterator[Any]:
+    buffer = ''
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for chunk in chunks:
+        offset = len(buffer)
+        buffer += chunk
+        for i in range(offset, len(buffer)):
+            char = buffer[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = depth > 0
+            elif char == '{':
+                if depth == 0:
+                    start = i
+                depth += 1
+            elif char == '}' and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    try:
+                        yield json.loads(buffer[start:i + 1])
+                    except ValueError:
+                        pass
+        if depth == 0:
+            buffer = ''
+
+def strip_json_fence(content: str) -> str:
+    content = content.strip()
+    if content.startswith('```json'):
+        content = content[7:]
+    if content.startswith('```'):
+        content = content[3:]
+    if content.endswith('```'):
+        content = content[:-3]
+    return content.strip()
+
+def parse_json(content: str) -> Any:
+    return json.loads(strip_json_fence(content))
+
+def parse_json_objects(content: str) -> List[Any]:
+    content = strip_json_fence(content)
+    try:
+        result = json.loads(content)
+        return result if isinstance(result, list) else [result]
+    except ValueError:
+        pass
+    
+    decoder = json.JSONDecoder()
+    objects = []
+    pos = content.find('{')
+    while pos != -1:
+        try:
+            obj, end = decoder.raw_decode(content, pos)
+            objects.append(obj)
+            pos = content.find('{', end)
+        except ValueError:
+            pos = content.find('{', pos + 1)
+    return objects
@@ -7,75 +7,198 @@ Returns: HTTP response со списком слов или результато
 import json
 import os
 from typing import Dict, Any, List
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.extras import RealDictCursor, execute_values
 
-def generate_translation_and_examples(word: str) -> Dict[str, Any]:
-    api_key = os.environ.get('GENAPI_KEY', '')
-    if not api_key:
-        return {
-            'translation': 'перевод генерируется...',
-            'examples': ['Примеры будут добавлены']
+import db
+import genapi
+import pagination
+import response_cache
+
+PLACEHOLDER_TRANSLATION = 'перевод генерируется...'
+DICTIONARY_TTL_DAYS = int(os.environ.get('DICTIONARY_TTL_DAYS', '90'))
+ENRICHMENT_CONCURRENCY = max(1, int(os.environ.get('ENRICHMENT_CONCURRENCY', '5')))
+ENRICHMENT_BATCH_SIZE = max(1, int(os.environ.get('ENRICHMENT_BATCH_SIZE', '10')))
+BATCH_TIMEOUT = 60
+ENRICHMENT_ASYNC = os.environ.get('ENRICHMENT_ASYNC', 'true').lower() == 'true'
+
+def normalize_word(word: str) -> str:
+    return ' '.join(word.split()).lower()
+
+def get_cached_translations(cursor, words: List[str]) -> Dict[str, Dict[str, Any]]:
+    cursor.execute(
+        """SELECT english_word, russian_translation, examples
+           FROM t_p7147437_shag_to_speak.dictionary
+           WHERE english_word = ANY(%s)
+             AND updated_at >= CURRENT_TIMESTAMP - make_interval(days => %s)""",
+        ([normalize_word(w) for w in words], DICTIONARY_TTL_DAYS)
+    )
+    return {
+        row['english_word']: {
+            'translation': row['russian_translation'],
+            'examples': row['examples'] or []
         }
+        for row in cursor.fetchall()
+    }
+
+def save_cached_translation(cursor, word: str, gen_data: Dict[str, Any]) -> None:
+    if gen_data['translation'] == PLACEHOLDER_TRANSLATION:
+        return
+    
+    cursor.execute(
+        """INSERT INTO t_p7147437_shag_to_speak.dictionary
+           (english_word, russian_translation, examples)
+           VALUES (%s, %s, %s)
+           ON CONFLICT (english_word) DO UPDATE
+           SET russian_translation = EXCLUDED.russian_translation,
+               examples = EXCLUDED.examples,
+               updated_at = CURRENT_TIMESTAMP""",
+        (normalize_word(word), gen_data['translation'], gen_data['examples'])
+    )
+
+def enrich_words(cursor, words: List[str]) -> Dict[str, Dict[str, Any]]:
+    enriched = get_cached_translations(cursor, words)
+    missing = [w for w in words if w not in enriched]
+    
+    if missing:
+        generated: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=ENRICHMENT_CONCURRENCY) as executor:
+            if ENRICHMENT_BATCH_SIZE > 1:
+                chunks = [missing[i:i + ENRICHMENT_BATCH_SIZE] for i in range(0, len(missing), ENRICHMENT_BATCH_SIZE)]
+                for chunk_result in executor.map(generate_translations_batch, chunks):
+                    generated.update(chunk_result)
+            
+            fallback = [w for w in missing if w not in generated]
+            for word, gen_data in zip(fallback, executor.map(generate_translation_and_examples, fallback)):
+                generated[word] = gen_data
+        
+        for word in missing:
+            save_cached_translation(cursor, word, generated[word])
+            enriched[word] = generated[word]
     
+    return enriched
+
+def generate_translation_and_examples(word: str) -> Dict[str, Any]:
     try:
-        response = requests.post(
-            'https://api.gen-api.ru/api/v1/networks/o1-mini',
-            headers={
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                'Authorization': f'Bearer {api_key}'
-            },
-            json={
-                'is_sync': True,
-                'messages': [{
-                    'role': 'user',
-                    'content': f'Переведи английское слово "{word}" на русский язык и дай 3 коротких примера использования этого слова на английском языке. Ответь ТОЛЬКО в формате JSON без дополнительного текста: {{"translation": "краткий русский перевод", "examples": ["Example 1 with {word}", "Example 2 with {word}", "Example 3 with {word}"]}}'
-                }],
-                'model': 'o1-mini-2024-09-12',
-                'stream': False,
-                'temperature': 1
-            },
+        content = genapi.complete(
+            f'Переведи английское слово "{word}" на русский язык и дай 3 коротких примера использования этого слова на английском языке. Ответь ТОЛЬКО в формате JSON без дополнительного текста: {{"translation": "краткий русский перевод", "examples": ["Example 1 with {word}", "Example 2 with {word}", "Example 3 with {word}"]}}',
             timeout=30
         )
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            if 'output' in data and 'choices' in data['output']:
-                content = data['output']['choices'][0]['message']['content']
-                content_clean = content.strip()
-                
-                if content_clean.startswith('```json'):
-                    content_clean = content_clean[7:]
-                if content_clean.startswith('```'):
-                    content_clean = content_clean[3:]
-                if content_clean.endswith('```'):
-                    content_clean = content_clean[:-3]
-                content_clean = content_clean.strip()
-                
-                result = json.loads(content_clean)
-                return {
-                    'translation': result.get('translation', 'перевод'),
-                    'examples': result.get('examples', ['Пример 1', 'Пример 2', 'Пример 3'])
-                }
-            else:
-                return {
-                    'translation': 'перевод генерируется...',
-                    'examples': ['Примеры будут добавлены']
-                }
-        else:
-            return {
-                'translation': 'перевод генерируется...',
-                'examples': ['Примеры будут добавлены']
-            }
+        result = genapi.parse_json(content)
+        return {
+            'translation': result.get('translation', 'перевод'),
+            'examples': result.get('examples', ['Пример 1', 'Пример 2', 'Пример 3'])
+        }
     except Exception as e:
         return {
-            'translation': 'перевод генерируется...',
+            'translation': PLACEHOLDER_TRANSLATION,
             'examples': ['Примеры будут добавлены']
         }
 
+def generate_translations_batch(words: List[str]) -> Dict[str, Dict[str, Any]]:
+    if not words or not genapi.is_available():
+        return {}
+    
+    words_json = json.dumps(words, ensure_ascii=False)
+    try:
+        content = genapi.complete(
+            f'Переведи английские слова {words_json} на русский язык и для каждого слова дай 3 коротких примера использования на английском языке. Ответь ТОЛЬКО в формате JSON массива без дополнительного текста, по одному объекту на каждое слово: [{{"word": "english_word", "translation": "краткий русский перевод", "examples": ["Example 1", "Example 2", "Example 3"]}}]',
+            timeout=BATCH_TIMEOUT
+        )
+    except Exception as e:
+        return {}
+    
+    requested = set(words)
+    generated = {}
+    for item in genapi.parse_json_objects(content):
+        if not isinstance(item, dict) or not isinstance(item.get('word'), str):
+            continue
+        
+        word = normalize_word(item['word'])
+        translation = item.get('translation')
+        examples = item.get('examples')
+        if word not in requested or not isinstance(translation, str) or not translation.strip():
+            continue
+        if not isinstance(examples, list) or not examples:
+            continue
+        
+        generated[word] = {
+            'translation': translation.strip(),
+            'examples': [str(ex) for ex in examples][:3]
+        }
+    return generated
+
+def insert_words_bulk(cursor, rows: List[tuple]) -> List[Dict[str, Any]]:
+    if not rows:
+        return []
+    
+    inserted = execute_values(
+        cursor,
+        """WITH inserted AS (
+               INSERT INTO t_p7147437_shag_to_speak.words
+               (user_id, english_word, russian_translation, examples, status, recall_count, enrichment_status)
+               VALUES %s
+               ON CONFLICT (user_id, english_word) DO NOTHING
+               RETURNING id, english_word, russian_translation, examples, status, recall_count, enrichment_status
+           ), queued AS (
+               INSERT INTO t_p7147437_shag_to_speak.enrichment_jobs (word_id, english_word)
+               SELECT id, english_word FROM inserted WHERE enrichment_status = 'pending'
+           )
+           SELECT * FROM inserted""",
+        rows,
+        template="(%s, %s, %s, %s::text[], 'learning', 0, %s)",
+        page_size=len(rows),
+        fetch=True
+    )
+    order = {row[1]: i for i, row in enumerate(rows)}
+    return [
+        {
+            'id': word['id'],
+            'english_word': word['english_word'],
+            'russian_translation': word['russian_translation'],
+            'examples': word['examples'],
+            'status': word['status'],
+            'recall_count': word['recall_count'],
+            'enrichment_status': word['enrichment_status']
+        }
+        for word in sorted(inserted, key=lambda w: order.get(w['english_word'], 0))
+    ]
+
+def install_word_set(cursor, user_id: int, set_id: str) -> List[Dict[str, Any]]:
+    cursor.execute(
+        """WITH inserted AS (
+               INSERT INTO t_p7147437_shag_to_speak.words
+               (user_id, english_word, russian_translation, examples, status, recall_count, enrichment_status)
+               SELECT %s, e.english_word,
+                      COALESCE(e.russian_translation, %s),
+                      COALESCE(e.examples, '{}'),
+                      'learning', 0,
+                      CASE WHEN e.russian_translation IS NULL THEN 'pending' ELSE 'ready' END
+               FROM t_p7147437_shag_to_speak.word_set_entries e
+               WHERE e.set_id = %s
+               ORDER BY e.position
+               ON CONFLICT (user_id, english_word) DO NOTHING
+               RETURNING id, english_word, russian_translation, examples, status, recall_count, enrichment_status
+           ), queued AS (
+               INSERT INTO t_p7147437_shag_to_speak.enrichment_jobs (word_id, english_word)
+               SELECT id, english_word FROM inserted WHERE enrichment_status = 'pending'
+           )
+           SELECT * FROM inserted""",
+        (user_id, PLACEHOLDER_TRANSLATION, set_id)
+    )
+    return [
+        {
+            'id': word['id'],
+            'english_word': word['english_word'],
+            'russian_translation': word['russian_translation'],
+            'examples': word['examples'],
+            'status': word['status'],
+            'recall_count': word['recall_count'],
+            'enrichment_status': word['enrichment_status']
+        }
+        for word in cursor.fetchall()
+    ]
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
@@ -85,7 +208,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'headers': {
                 'Access-Control-Allow-Origin': '*',
                 'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, X-User-Id, X-Auth-Token',
+                'Access-Control-Allow-Headers': 'Content-Type, X-User-Id, X-Auth-Token, If-None-Match',
                 'Access-Control-Max-Age': '86400'
             },
             'body': '',
@@ -105,20 +228,75 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     user_id = int(user_id_str)
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    conn = db.get_connection()
     cursor = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
         if method == 'GET':
-            cursor.execute(
-                """SELECT id, english_word, russian_translation, examples, status, recall_count, 
-                          last_recall_date, created_at
-                   FROM t_p7147437_shag_to_speak.words 
-                   WHERE user_id = %s
-                   ORDER BY created_at DESC""",
-                (user_id,)
-            )
-            words = cursor.fetchall()
+            query_params = event.get('queryStringParameters', {}) or {}
+            
+            version = response_cache.get_data_version(cursor, user_id)
+            etag = response_cache.make_etag(user_id, version)
+            if response_cache.is_not_modified(headers, etag):
+                return response_cache.not_modified_response(etag)
+            
+            cache_key = ('words', user_id, version, tuple(sorted(query_params.items())))
+            cached_body = response_cache.get_body(cache_key)
+            if cached_body is not None:
+                return response_cache.json_response(cached_body, etag)
+            
+            ids_param = query_params.get('ids', '')
+            word_ids = [int(i) for i in ids_param.split(',') if i.strip().isdigit()]
+            
+            if word_ids:
+                cursor.execute(
+                    """SELECT id, english_word, russian_translation, examples, status, recall_count, 
+                              last_recall_date, created_at, enrichment_status
+                       FROM t_p7147437_shag_to_speak.words 
+                       WHERE user_id = %s AND id = ANY(%s)
+                       ORDER BY created_at DESC, id DESC""",
+                    (user_id, word_ids)
+                )
+                words = cursor.fetchall()
+                next_page = None
+            else:
+                status_filter = query_params.get('status') or None
+                if status_filter not in (None, 'all', 'learning', 'done'):
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': 'Invalid status filter'}),
+                        'isBase64Encoded': False
+                    }
+                if status_filter == 'all':
+                    status_filter = None
+                
+                try:
+                    after = pagination.decode_cursor(query_params.get('cursor'))
+                except pagination.InvalidCursor as e:
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': str(e)}),
+                        'isBase64Encoded': False
+                    }
+                
+                limit = pagination.page_size(query_params.get('limit'))
+                after_created, after_id = after if after else (None, None)
+                cursor.execute(
+                    """SELECT id, english_word, russian_translation, examples, status, recall_count, 
+                              last_recall_date, created_at, enrichment_status
+                       FROM t_p7147437_shag_to_speak.words 
+                       WHERE user_id = %s
+                         AND (%s::varchar IS NULL OR status = %s)
+                         AND (%s::timestamp IS NULL OR (created_at, id) < (%s, %s))
+                       ORDER BY created_at DESC, id DESC
+                       LIMIT %s""",
+                    (user_id, status_filter, status_filter, after_created, after_created, after_id, limit + 1)
+                )
+                words = cursor.fetchall()
+                next_page = pagination.next_cursor(words, limit)
+                words = words[:limit]
             
             words_list = []
             for word in words:
@@ -130,21 +308,47 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'status': word['status'],
                     'recall_count': word['recall_count'] or 0,
                     'last_recall_date': word['last_recall_date'].isoformat() if word['last_recall_date'] else None,
-                    'created_at': word['created_at'].isoformat() if word['created_at'] else None
+                    'created_at': word['created_at'].isoformat() if word['created_at'] else None,
+                    'enrichment_status': word['enrichment_status']
                 })
             
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps({'words': words_list}),
-                'isBase64Encoded': False
-            }
+            body = json.dumps({'words': words_list, 'next_cursor': next_page})
+            response_cache.put_body(cache_key, body)
+            
+            return response_cache.json_response(body, etag)
         
         elif method == 'POST':
             body_data = json.loads(event.get('body', '{}'))
             words_input = body_data.get('words', [])
+            set_id = body_data.get('set_id')
             
-            if not words_input:
+            if set_id:
+                cursor.execute(
+                    """SELECT EXISTS (
+                              SELECT 1 FROM t_p7147437_shag_to_speak.word_sets WHERE id = %s
+                          ) as found,
+                          (SELECT COUNT(*)
+                           FROM t_p7147437_shag_to_speak.word_set_entries e
+                           WHERE e.set_id = %s
+                             AND NOT EXISTS (
+                                 SELECT 1 FROM t_p7147437_shag_to_speak.words w
+                                 WHERE w.user_id = %s AND w.english_word = e.english_word
+                             )) as count""",
+                    (set_id, set_id, user_id)
+                )
+                word_set = cursor.fetchone()
+                if not word_set['found']:
+                    return {
+                        'statusCode': 404,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': 'Word set not found'}),
+                        'isBase64Encoded': False
+                    }
+                requested_count = word_set['count']
+            else:
+                requested_count = len(words_input)
+            
+            if not words_input and not set_id:
                 return {
                     'statusCode': 400,
                     'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
@@ -153,7 +357,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 }
             
             cursor.execute(
-                "SELECT status FROM t_p7147437_shag_to_speak.users WHERE id = %s",
+                "SELECT status, word_count FROM t_p7147437_shag_to_speak.users WHERE id = %s",
                 (user_id,)
             )
             user = cursor.fetchone()
@@ -165,14 +369,10 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'isBase64Encoded': False
                 }
             
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM t_p7147437_shag_to_speak.words WHERE user_id = %s",
-                (user_id,)
-            )
-            current_count = cursor.fetchone()['count']
+            current_count = user['word_count']
             
             word_limit = 50 if user['status'] == 'free' else 999
-            if current_count + len(words_input) > word_limit:
+            if current_count + requested_count > word_limit:
                 return {
                     'statusCode': 403,
                     'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
@@ -180,37 +380,47 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'isBase64Encoded': False
                 }
             
-            added_words = []
-            for word_text in words_input:
-                word_text = word_text.strip().lower()
-                if not word_text:
-                    continue
+            if set_id:
+                added_words = install_word_set(cursor, user_id, set_id)
+                conn.commit()
                 
-                gen_data = generate_translation_and_examples(word_text)
-                
-                cursor.execute(
-                    """INSERT INTO t_p7147437_shag_to_speak.words 
-                       (user_id, english_word, russian_translation, examples, status, recall_count)
-                       VALUES (%s, %s, %s, %s, 'learning', 0)
-                       RETURNING id, english_word, russian_translation, examples, status, recall_count""",
-                    (user_id, word_text, gen_data['translation'], gen_data['examples'])
-                )
-                new_word = cursor.fetchone()
-                added_words.append({
-                    'id': new_word['id'],
-                    'english_word': new_word['english_word'],
-                    'russian_translation': new_word['russian_translation'],
-                    'examples': new_word['examples'],
-                    'status': new_word['status'],
-                    'recall_count': new_word['recall_count']
-                })
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'words': added_words, 'count': len(added_words), 'set_id': set_id}),
+                    'isBase64Encoded': False
+                }
+            
+            words_to_add = list(dict.fromkeys(normalize_word(w) for w in words_input if normalize_word(w)))
+            cursor.execute(
+                """SELECT english_word FROM t_p7147437_shag_to_speak.words
+                   WHERE user_id = %s AND english_word = ANY(%s)""",
+                (user_id, words_to_add)
+            )
+            existing_words = [row['english_word'] for row in cursor.fetchall()]
+            words_to_add = [w for w in words_to_add if w not in existing_words]
+            
+            if body_data.get('async', ENRICHMENT_ASYNC):
+                enriched = get_cached_translations(cursor, words_to_add)
+            else:
+                enriched = enrich_words(cursor, words_to_add)
+            
+            rows = []
+            for word_text in words_to_add:
+                gen_data = enriched.get(word_text) or {'translation': PLACEHOLDER_TRANSLATION, 'examples': []}
+                enrichment_status = 'pending' if gen_data['translation'] == PLACEHOLDER_TRANSLATION else 'ready'
+                rows.append((user_id, word_text, gen_data['translation'], gen_data['examples'], enrichment_status))
+            
+            added_words = insert_words_bulk(cursor, rows)
+            added_set = {w['english_word'] for w in added_words}
+            skipped = existing_words + [w for w in words_to_add if w not in added_set]
             
             conn.commit()
             
             return {
                 'statusCode': 200,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps({'words': added_words, 'count': len(added_words)}),
+                'body': json.dumps({'words': added_words, 'count': len(added_words), 'skipped': skipped}),
                 'isBase64Encoded': False
             }
         
@@ -296,4 +506,4 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     finally:
         cursor.close()
-        conn.close()
\ No newline at end of file
+        db.release_connection(conn)
\ No newline at end of file
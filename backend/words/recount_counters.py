@@ -0,0 +1,33 @@
+"""
+Business: Сверка денормализованных счётчиков словаря в users с таблицей words
+Args: DATABASE_URL в окружении; python recount_counters.py [user_id ...]
+Returns: ничего, печатает количество исправленных пользователей
+"""
+
+import os
+import sys
+from typing import List
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+def recount(conn, user_ids: List[int]) -> int:
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    repaired = 0
+    try:
+        for user_id in user_ids or [None]:
+            cursor.execute(
+                "SELECT t_p7147437_shag_to_speak.recount_word_counters(%s) as repaired",
+                (user_id,)
+            )
+            repaired += cursor.fetchone()['repaired']
+            conn.commit()
+    finally:
+        cursor.close()
+    return repaired
+
+if __name__ == '__main__':
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        print(f'repaired {recount(connection, [int(arg) for arg in sys.argv[1:]])} users')
+    finally:
+        connection.close()
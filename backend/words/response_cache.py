@@ -0,0 +1,73 @@
+"""
+Business: Условные GET по версии данных пользователя - ETag, 304 и кэш готовых тел ответов в памяти процесса
+Args: курсор, user_id и заголовки запроса; ключ кэша включает версию данных
+Returns: ETag, ответ 304 или ранее отрендеренное тело
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', '1024'))
+
+_cache: 'OrderedDict[Hashable, str]' = OrderedDict()
+_lock = threading.Lock()
+
+def get_data_version(cursor, user_id: int) -> Optional[int]:
+    cursor.execute(
+        "SELECT data_version FROM t_p7147437_shag_to_speak.users WHERE id = %s",
+        (user_id,)
+    )
+    row = cursor.fetchone()
+    return row['data_version'] if row else None
+
+def make_etag(*parts: Any) -> str:
+    return '"' + '-'.join(str(part) for part in parts) + '"'
+
+def is_not_modified(headers: Dict[str, str], etag: str) -> bool:
+    header = headers.get('If-None-Match') or headers.get('if-none-match')
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+def not_modified_response(etag: str) -> Dict[str, Any]:
+    return {
+        'statusCode': 304,
+        'headers': {
+            'ETag': etag,
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Expose-Headers': 'ETag'
+        },
+        'body': '',
+        'isBase64Encoded': False
+    }
+
+def json_response(body: str, etag: str) -> Dict[str, Any]:
+    return {
+        'statusCode': 200,
+        'headers': {
+            'Content-Type': 'application/json',
+            'ETag': etag,
+            'Cache-Control': 'no-cache',
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Expose-Headers': 'ETag'
+        },
+        'body': body,
+        'isBase64Encoded': False
+    }
+
+def get_body(key: Hashable) -> Optional[str]:
+    with _lock:
+        body = _cache.get(key)
+        if body is not None:
+            _cache.move_to_end(key)
+        return body
+
+def put_body(key: Hashable, body: str) -> None:
+    with _lock:
+        _cache[key] = body
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
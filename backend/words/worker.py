@@ -0,0 +1,94 @@
+"""
+Business: Фоновый воркер обогащения слов - разбирает очередь enrichment_jobs и заполняет перевод и примеры
+Args: DATABASE_URL и GENAPI_KEY в окружении; несколько воркеров могут работать параллельно
+Returns: ничего, работает до остановки процесса (python worker.py)
+"""
+
+import os
+import time
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+from index import enrich_words, PLACEHOLDER_TRANSLATION
+
+WORKER_BATCH_SIZE = int(os.environ.get('ENRICHMENT_WORKER_BATCH', '20'))
+POLL_INTERVAL = float(os.environ.get('ENRICHMENT_POLL_INTERVAL', '2'))
+MAX_ATTEMPTS = int(os.environ.get('ENRICHMENT_MAX_ATTEMPTS', '5'))
+
+def drain_once(conn) -> int:
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    try:
+        cursor.execute(
+            """SELECT id, word_id, english_word, attempts
+               FROM t_p7147437_shag_to_speak.enrichment_jobs
+               WHERE run_after <= CURRENT_TIMESTAMP
+               ORDER BY run_after, id
+               LIMIT %s
+               FOR UPDATE SKIP LOCKED""",
+            (WORKER_BATCH_SIZE,)
+        )
+        jobs = cursor.fetchall()
+        if not jobs:
+            conn.commit()
+            return 0
+        
+        enriched = enrich_words(cursor, list(dict.fromkeys(job['english_word'] for job in jobs)))
+        
+        for job in jobs:
+            gen_data = enriched[job['english_word']]
+            
+            if gen_data['translation'] == PLACEHOLDER_TRANSLATION:
+                attempts = job['attempts'] + 1
+                if attempts >= MAX_ATTEMPTS:
+                    cursor.execute(
+                        """UPDATE t_p7147437_shag_to_speak.words
+                           SET enrichment_status = 'failed'
+                           WHERE id = %s""",
+                        (job['word_id'],)
+                    )
+                    cursor.execute(
+                        "DELETE FROM t_p7147437_shag_to_speak.enrichment_jobs WHERE id = %s",
+                        (job['id'],)
+                    )
+                else:
+                    cursor.execute(
+                        """UPDATE t_p7147437_shag_to_speak.enrichment_jobs
+                           SET attempts = %s,
+                               run_after = CURRENT_TIMESTAMP + make_interval(secs => %s)
+                           WHERE id = %s""",
+                        (attempts, 30 * 2 ** attempts, job['id'])
+                    )
+                continue
+            
+            cursor.execute(
+                """UPDATE t_p7147437_shag_to_speak.words
+                   SET russian_translation = %s,
+                       examples = %s,
+                       enrichment_status = 'ready'
+                   WHERE id = %s AND enrichment_status = 'pending'""",
+                (gen_data['translation'], gen_data['examples'], job['word_id'])
+            )
+            cursor.execute(
+                "DELETE FROM t_p7147437_shag_to_speak.enrichment_jobs WHERE id = %s",
+                (job['id'],)
+            )
+        
+        conn.commit()
+        return len(jobs)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+def run_forever() -> None:
+    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        while True:
+            if drain_once(conn) == 0:
+                time.sleep(POLL_INTERVAL)
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    run_forever()
@@ -0,0 +1,11 @@
+-- Общий словарь переводов для всех пользователей (кэш ответов GenAPI)
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.dictionary (
+    english_word VARCHAR(255) PRIMARY KEY,
+    russian_translation TEXT NOT NULL,
+    examples TEXT[] DEFAULT '{}',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Индекс для вытеснения устаревших записей
+CREATE INDEX IF NOT EXISTS idx_dictionary_updated_at ON t_p7147437_shag_to_speak.dictionary(updated_at);
\ No newline at end of file
@@ -0,0 +1,17 @@
+-- Состояние ИИ-обогащения слова: pending - ждёт воркера, ready - перевод готов, failed - попытки исчерпаны
+ALTER TABLE t_p7147437_shag_to_speak.words 
+ADD COLUMN IF NOT EXISTS enrichment_status VARCHAR(20) DEFAULT 'ready' CHECK (enrichment_status IN ('pending', 'ready', 'failed'));
+
+-- Очередь заданий на обогащение слов, разбирается воркером через FOR UPDATE SKIP LOCKED
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.enrichment_jobs (
+    id SERIAL PRIMARY KEY,
+    word_id INTEGER NOT NULL REFERENCES t_p7147437_shag_to_speak.words(id) ON DELETE CASCADE,
+    english_word VARCHAR(255) NOT NULL,
+    attempts INTEGER DEFAULT 0,
+    run_after TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(word_id)
+);
+
+-- Индекс для выборки готовых к запуску заданий
+CREATE INDEX IF NOT EXISTS idx_enrichment_jobs_run_after ON t_p7147437_shag_to_speak.enrichment_jobs(run_after, id);
\ No newline at end of file
@@ -0,0 +1,12 @@
+-- Кэш результатов ИИ-генерации слов по теме (ключ - нормализованный запрос и количество слов)
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.prompt_cache (
+    prompt_key VARCHAR(500) NOT NULL,
+    word_count INTEGER NOT NULL,
+    words JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (prompt_key, word_count)
+);
+
+-- Индекс для вытеснения давно не использованных записей
+CREATE INDEX IF NOT EXISTS idx_prompt_cache_last_used_at ON t_p7147437_shag_to_speak.prompt_cache(last_used_at);
\ No newline at end of file
@@ -0,0 +1,22 @@
+-- Каталог готовых наборов слов (зеркало src/data/wordSets.ts) с заранее сгенерированными переводами
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.word_sets (
+    id VARCHAR(100) PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    topic VARCHAR(100) NOT NULL,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Слова наборов; перевод и примеры заполняет офлайн-скрипт backend/words/enrich_sets.py
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.word_set_entries (
+    set_id VARCHAR(100) NOT NULL REFERENCES t_p7147437_shag_to_speak.word_sets(id) ON DELETE CASCADE,
+    english_word VARCHAR(255) NOT NULL,
+    position INTEGER NOT NULL,
+    russian_translation TEXT,
+    examples TEXT[],
+    enriched_at TIMESTAMP,
+    PRIMARY KEY (set_id, english_word)
+);
+
+-- Индекс для поиска ещё не обогащённых слов
+CREATE INDEX IF NOT EXISTS idx_word_set_entries_pending ON t_p7147437_shag_to_speak.word_set_entries(english_word) WHERE russian_translation IS NULL;
\ No newline at end of file
@@ -0,0 +1,3 @@
+-- Индексы для keyset-пагинации словаря по (created_at, id) с фильтром по статусу и без него
+CREATE INDEX IF NOT EXISTS idx_words_user_created ON t_p7147437_shag_to_speak.words(user_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_words_user_status_created ON t_p7147437_shag_to_speak.words(user_id, status, created_at DESC, id DESC);
\ No newline at end of file
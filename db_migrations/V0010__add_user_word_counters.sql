@@ -0,0 +1,114 @@
+-- Денормализованные счётчики словаря пользователя
+ALTER TABLE t_p7147437_shag_to_speak.users 
+ADD COLUMN IF NOT EXISTS word_count INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS learning_count INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS done_count INTEGER NOT NULL DEFAULT 0;
+
+-- Пересчёт счётчиков по таблице words: для одного пользователя или для всех, возвращает число исправленных строк
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.recount_word_counters(p_user_id INTEGER DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    repaired INTEGER;
+BEGIN
+    UPDATE t_p7147437_shag_to_speak.users u
+    SET word_count = c.total,
+        learning_count = c.learning,
+        done_count = c.done
+    FROM (
+        SELECT uu.id,
+               COUNT(w.id) AS total,
+               COUNT(w.id) FILTER (WHERE w.status = 'learning') AS learning,
+               COUNT(w.id) FILTER (WHERE w.status = 'done') AS done
+        FROM t_p7147437_shag_to_speak.users uu
+        LEFT JOIN t_p7147437_shag_to_speak.words w ON w.user_id = uu.id
+        WHERE p_user_id IS NULL OR uu.id = p_user_id
+        GROUP BY uu.id
+    ) c
+    WHERE u.id = c.id
+      AND (u.word_count, u.learning_count, u.done_count) IS DISTINCT FROM (c.total, c.learning, c.done);
+    GET DIAGNOSTICS repaired = ROW_COUNT;
+    RETURN repaired;
+END;
+$$;
+
+-- Триггерная функция: применяет к users суммарную дельту изменённых строк words за оператор
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.apply_word_counter_delta()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE t_p7147437_shag_to_speak.users u
+        SET word_count = u.word_count + d.total,
+            learning_count = u.learning_count + d.learning,
+            done_count = u.done_count + d.done
+        FROM (
+            SELECT user_id,
+                   COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE status = 'learning') AS learning,
+                   COUNT(*) FILTER (WHERE status = 'done') AS done
+            FROM new_rows
+            GROUP BY user_id
+        ) d
+        WHERE u.id = d.user_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE t_p7147437_shag_to_speak.users u
+        SET word_count = u.word_count - d.total,
+            learning_count = u.learning_count - d.learning,
+            done_count = u.done_count - d.done
+        FROM (
+            SELECT user_id,
+                   COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE status = 'learning') AS learning,
+                   COUNT(*) FILTER (WHERE status = 'done') AS done
+            FROM old_rows
+            GROUP BY user_id
+        ) d
+        WHERE u.id = d.user_id;
+    ELSE
+        UPDATE t_p7147437_shag_to_speak.users u
+        SET word_count = u.word_count + d.total,
+            learning_count = u.learning_count + d.learning,
+            done_count = u.done_count + d.done
+        FROM (
+            SELECT user_id,
+                   SUM(sign) AS total,
+                   COALESCE(SUM(sign) FILTER (WHERE status = 'learning'), 0) AS learning,
+                   COALESCE(SUM(sign) FILTER (WHERE status = 'done'), 0) AS done
+            FROM (
+                SELECT user_id, status, 1 AS sign FROM new_rows
+                UNION ALL
+                SELECT user_id, status, -1 AS sign FROM old_rows
+            ) changes
+            GROUP BY user_id
+        ) d
+        WHERE u.id = d.user_id
+          AND (d.total <> 0 OR d.learning <> 0 OR d.done <> 0);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- Статементные триггеры с переходными таблицами: одна корректировка users на пакетную вставку
+DROP TRIGGER IF EXISTS trg_words_counters_insert ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_counters_insert
+AFTER INSERT ON t_p7147437_shag_to_speak.words
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.apply_word_counter_delta();
+
+DROP TRIGGER IF EXISTS trg_words_counters_update ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_counters_update
+AFTER UPDATE ON t_p7147437_shag_to_speak.words
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.apply_word_counter_delta();
+
+DROP TRIGGER IF EXISTS trg_words_counters_delete ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_counters_delete
+AFTER DELETE ON t_p7147437_shag_to_speak.words
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.apply_word_counter_delta();
+
+-- Заполняем счётчики для существующих пользователей
+SELECT t_p7147437_shag_to_speak.recount_word_counters();
\ No newline at end of file
@@ -0,0 +1,7 @@
+-- Случайный ключ для выборки упражнений без ORDER BY RANDOM(): заполняется random() для каждой строки
+ALTER TABLE t_p7147437_shag_to_speak.words 
+ADD COLUMN IF NOT EXISTS sample_key DOUBLE PRECISION NOT NULL DEFAULT random();
+
+-- Индексы для выборки окна слов от случайной точки: среди изучаемых и среди всего словаря
+CREATE INDEX IF NOT EXISTS idx_words_user_status_sample ON t_p7147437_shag_to_speak.words(user_id, status, sample_key);
+CREATE INDEX IF NOT EXISTS idx_words_user_sample ON t_p7147437_shag_to_speak.words(user_id, sample_key);
\ No newline at end of file
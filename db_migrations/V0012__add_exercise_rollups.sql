@@ -0,0 +1,112 @@
+-- Итоги упражнений пользователя
+ALTER TABLE t_p7147437_shag_to_speak.users 
+ADD COLUMN IF NOT EXISTS exercises_total INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS exercises_correct INTEGER NOT NULL DEFAULT 0;
+
+-- Дневная активность пользователя для недельного графика
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.user_daily_activity (
+    user_id INTEGER NOT NULL REFERENCES t_p7147437_shag_to_speak.users(id),
+    day DATE NOT NULL,
+    exercise_count INTEGER NOT NULL DEFAULT 0,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, day)
+);
+
+-- Индекс word_progress для топ-10 слов по верным ответам
+CREATE INDEX IF NOT EXISTS idx_word_progress_user_top ON t_p7147437_shag_to_speak.word_progress(user_id, correct_count DESC, total_count DESC);
+
+-- Триггерная функция: переносит вставленные упражнения в users, user_daily_activity и word_progress одной дельтой за оператор
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.apply_exercise_rollups()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE t_p7147437_shag_to_speak.users u
+    SET exercises_total = u.exercises_total + d.total,
+        exercises_correct = u.exercises_correct + d.correct
+    FROM (
+        SELECT user_id, COUNT(*) AS total, COUNT(*) FILTER (WHERE is_correct) AS correct
+        FROM new_rows
+        GROUP BY user_id
+    ) d
+    WHERE u.id = d.user_id;
+
+    INSERT INTO t_p7147437_shag_to_speak.user_daily_activity (user_id, day, exercise_count, correct_count)
+    SELECT user_id, created_at::date, COUNT(*), COUNT(*) FILTER (WHERE is_correct)
+    FROM new_rows
+    GROUP BY user_id, created_at::date
+    ON CONFLICT (user_id, day) DO UPDATE
+    SET exercise_count = user_daily_activity.exercise_count + EXCLUDED.exercise_count,
+        correct_count = user_daily_activity.correct_count + EXCLUDED.correct_count;
+
+    INSERT INTO t_p7147437_shag_to_speak.word_progress (user_id, word_id, correct_count, total_count, last_reviewed)
+    SELECT user_id, word_id, COUNT(*) FILTER (WHERE is_correct), COUNT(*), MAX(created_at)
+    FROM new_rows
+    GROUP BY user_id, word_id
+    ON CONFLICT (user_id, word_id) DO UPDATE
+    SET correct_count = COALESCE(word_progress.correct_count, 0) + EXCLUDED.correct_count,
+        total_count = COALESCE(word_progress.total_count, 0) + EXCLUDED.total_count,
+        last_reviewed = GREATEST(word_progress.last_reviewed, EXCLUDED.last_reviewed);
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_exercises_rollups ON t_p7147437_shag_to_speak.exercises;
+CREATE TRIGGER trg_exercises_rollups
+AFTER INSERT ON t_p7147437_shag_to_speak.exercises
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.apply_exercise_rollups();
+
+-- Полная пересборка сводок из exercises: для одного пользователя или для всех
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.rebuild_exercise_rollups(p_user_id INTEGER DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    rebuilt INTEGER;
+BEGIN
+    UPDATE t_p7147437_shag_to_speak.users u
+    SET exercises_total = c.total,
+        exercises_correct = c.correct
+    FROM (
+        SELECT uu.id,
+               COUNT(e.id) AS total,
+               COUNT(e.id) FILTER (WHERE e.is_correct) AS correct
+        FROM t_p7147437_shag_to_speak.users uu
+        LEFT JOIN t_p7147437_shag_to_speak.exercises e ON e.user_id = uu.id
+        WHERE p_user_id IS NULL OR uu.id = p_user_id
+        GROUP BY uu.id
+    ) c
+    WHERE u.id = c.id;
+    GET DIAGNOSTICS rebuilt = ROW_COUNT;
+
+    DELETE FROM t_p7147437_shag_to_speak.user_daily_activity
+    WHERE p_user_id IS NULL OR user_id = p_user_id;
+
+    INSERT INTO t_p7147437_shag_to_speak.user_daily_activity (user_id, day, exercise_count, correct_count)
+    SELECT user_id, created_at::date, COUNT(*), COUNT(*) FILTER (WHERE is_correct)
+    FROM t_p7147437_shag_to_speak.exercises
+    WHERE p_user_id IS NULL OR user_id = p_user_id
+    GROUP BY user_id, created_at::date;
+
+    UPDATE t_p7147437_shag_to_speak.word_progress
+    SET correct_count = 0, total_count = 0
+    WHERE p_user_id IS NULL OR user_id = p_user_id;
+
+    INSERT INTO t_p7147437_shag_to_speak.word_progress (user_id, word_id, correct_count, total_count, last_reviewed)
+    SELECT user_id, word_id, COUNT(*) FILTER (WHERE is_correct), COUNT(*), MAX(created_at)
+    FROM t_p7147437_shag_to_speak.exercises
+    WHERE p_user_id IS NULL OR user_id = p_user_id
+    GROUP BY user_id, word_id
+    ON CONFLICT (user_id, word_id) DO UPDATE
+    SET correct_count = EXCLUDED.correct_count,
+        total_count = EXCLUDED.total_count,
+        last_reviewed = GREATEST(word_progress.last_reviewed, EXCLUDED.last_reviewed);
+
+    RETURN rebuilt;
+END;
+$$;
+
+-- Заполняем сводки по уже накопленной истории
+SELECT t_p7147437_shag_to_speak.rebuild_exercise_rollups();
\ No newline at end of file
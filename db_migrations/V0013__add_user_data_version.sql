@@ -0,0 +1,50 @@
+-- Версия данных пользователя для ETag: растёт при любом изменении его слов и упражнений
+ALTER TABLE t_p7147437_shag_to_speak.users 
+ADD COLUMN IF NOT EXISTS data_version BIGINT NOT NULL DEFAULT 0;
+
+-- Триггерная функция: увеличивает data_version всех пользователей, затронутых оператором
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.bump_user_data_version()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE t_p7147437_shag_to_speak.users
+        SET data_version = data_version + 1
+        WHERE id IN (SELECT user_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE t_p7147437_shag_to_speak.users
+        SET data_version = data_version + 1
+        WHERE id IN (SELECT user_id FROM old_rows);
+    ELSE
+        UPDATE t_p7147437_shag_to_speak.users
+        SET data_version = data_version + 1
+        WHERE id IN (SELECT user_id FROM new_rows UNION SELECT user_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_words_version_insert ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_version_insert
+AFTER INSERT ON t_p7147437_shag_to_speak.words
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.bump_user_data_version();
+
+DROP TRIGGER IF EXISTS trg_words_version_update ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_version_update
+AFTER UPDATE ON t_p7147437_shag_to_speak.words
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.bump_user_data_version();
+
+DROP TRIGGER IF EXISTS trg_words_version_delete ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_version_delete
+AFTER DELETE ON t_p7147437_shag_to_speak.words
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.bump_user_data_version();
+
+DROP TRIGGER IF EXISTS trg_exercises_version_insert ON t_p7147437_shag_to_speak.exercises;
+CREATE TRIGGER trg_exercises_version_insert
+AFTER INSERT ON t_p7147437_shag_to_speak.exercises
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.bump_user_data_version();
\ No newline at end of file
@@ -0,0 +1,12 @@
+-- Составные индексы под горячие запросы обработчиков (проверяются scripts/plan_check.py)
+CREATE INDEX IF NOT EXISTS idx_exercises_user_created ON t_p7147437_shag_to_speak.exercises(user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_exercises_word_correct ON t_p7147437_shag_to_speak.exercises(word_id, is_correct);
+CREATE INDEX IF NOT EXISTS idx_words_user_recall_count ON t_p7147437_shag_to_speak.words(user_id, recall_count DESC);
+CREATE INDEX IF NOT EXISTS idx_words_user_last_recall ON t_p7147437_shag_to_speak.words(user_id, last_recall_date);
+CREATE INDEX IF NOT EXISTS idx_word_progress_word_id ON t_p7147437_shag_to_speak.word_progress(word_id);
+
+-- Удаляем индексы, которые стали префиксами новых или дублируют уникальные ограничения
+DROP INDEX IF EXISTS t_p7147437_shag_to_speak.idx_exercises_user_id;
+DROP INDEX IF EXISTS t_p7147437_shag_to_speak.idx_exercises_word_id;
+DROP INDEX IF EXISTS t_p7147437_shag_to_speak.idx_words_user_status;
+DROP INDEX IF EXISTS t_p7147437_shag_to_speak.idx_word_progress_user_word;
\ No newline at end of file
@@ -0,0 +1,193 @@
+-- Переводим историю упражнений на помесячное секционирование по created_at
+ALTER TABLE t_p7147437_shag_to_speak.exercises RENAME TO exercises_legacy;
+ALTER INDEX t_p7147437_shag_to_speak.exercises_pkey RENAME TO exercises_legacy_pkey;
+ALTER SEQUENCE t_p7147437_shag_to_speak.exercises_id_seq OWNED BY NONE;
+
+CREATE TABLE t_p7147437_shag_to_speak.exercises (
+    id INTEGER NOT NULL DEFAULT nextval('t_p7147437_shag_to_speak.exercises_id_seq'),
+    user_id INTEGER NOT NULL REFERENCES t_p7147437_shag_to_speak.users(id),
+    word_id INTEGER NOT NULL REFERENCES t_p7147437_shag_to_speak.words(id),
+    exercise_type VARCHAR(50) NOT NULL,
+    is_correct BOOLEAN NOT NULL,
+    user_answer TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Секция по умолчанию ловит строки, для месяца которых секция ещё не создана
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.exercises_default
+PARTITION OF t_p7147437_shag_to_speak.exercises DEFAULT;
+
+-- Архив отсоединённых старых секций: сводки уже учитывают их, а пересборка читает архив вместе с exercises
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.exercises_archive (
+    id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    word_id INTEGER NOT NULL,
+    exercise_type VARCHAR(50) NOT NULL,
+    is_correct BOOLEAN NOT NULL,
+    user_answer TEXT,
+    created_at TIMESTAMP NOT NULL
+) PARTITION BY RANGE (created_at);
+
+-- Создание секции за месяц, возвращает TRUE, если секция создана
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.create_exercises_partition(p_month DATE)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE := date_trunc('month', p_month)::date;
+    partition_name TEXT := 'exercises_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    IF to_regclass('t_p7147437_shag_to_speak.' || partition_name) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+    EXECUTE format(
+        'CREATE TABLE t_p7147437_shag_to_speak.%I PARTITION OF t_p7147437_shag_to_speak.exercises FOR VALUES FROM (%L) TO (%L)',
+        partition_name, month_start, (month_start + INTERVAL '1 month')::date
+    );
+    RETURN TRUE;
+END;
+$$;
+
+-- Заранее создаёт секции на текущий и p_months_ahead следующих месяцев
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.ensure_exercises_partitions(p_months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    created INTEGER := 0;
+BEGIN
+    FOR i IN 0..p_months_ahead LOOP
+        IF t_p7147437_shag_to_speak.create_exercises_partition((CURRENT_DATE + make_interval(months => i))::date) THEN
+            created := created + 1;
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$;
+
+-- Переносит в архив секции старше p_keep_months месяцев, возвращает число перенесённых секций
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.archive_exercises_partitions(p_keep_months INTEGER DEFAULT 12)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    cutoff DATE := (date_trunc('month', CURRENT_DATE) - make_interval(months => p_keep_months))::date;
+    part RECORD;
+    month_start DATE;
+    archived INTEGER := 0;
+BEGIN
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 't_p7147437_shag_to_speak.exercises'::regclass
+          AND c.relname ~ '^exercises_[0-9]{4}_[0-9]{2}$'
+        ORDER BY c.relname
+    LOOP
+        month_start := to_date(substring(part.relname FROM 11), 'YYYY_MM');
+        CONTINUE WHEN month_start >= cutoff;
+        EXECUTE format('ALTER TABLE t_p7147437_shag_to_speak.exercises DETACH PARTITION t_p7147437_shag_to_speak.%I', part.relname);
+        EXECUTE format(
+            'ALTER TABLE t_p7147437_shag_to_speak.exercises_archive ATTACH PARTITION t_p7147437_shag_to_speak.%I FOR VALUES FROM (%L) TO (%L)',
+            part.relname, month_start, (month_start + INTERVAL '1 month')::date
+        );
+        archived := archived + 1;
+    END LOOP;
+    RETURN archived;
+END;
+$$;
+
+-- Секции под уже накопленную историю и на три месяца вперёд
+DO $$
+DECLARE
+    month_start DATE := date_trunc('month', COALESCE(
+        (SELECT MIN(created_at) FROM t_p7147437_shag_to_speak.exercises_legacy),
+        CURRENT_TIMESTAMP
+    ))::date;
+BEGIN
+    WHILE month_start <= (date_trunc('month', CURRENT_DATE) + INTERVAL '3 months')::date LOOP
+        PERFORM t_p7147437_shag_to_speak.create_exercises_partition(month_start);
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+END;
+$$;
+
+-- Копируем историю до создания триггеров, чтобы не задвоить сводки
+INSERT INTO t_p7147437_shag_to_speak.exercises (id, user_id, word_id, exercise_type, is_correct, user_answer, created_at)
+SELECT id, user_id, word_id, exercise_type, is_correct, user_answer, COALESCE(created_at, CURRENT_TIMESTAMP)
+FROM t_p7147437_shag_to_speak.exercises_legacy;
+
+DROP TABLE t_p7147437_shag_to_speak.exercises_legacy;
+ALTER SEQUENCE t_p7147437_shag_to_speak.exercises_id_seq OWNED BY t_p7147437_shag_to_speak.exercises.id;
+
+-- Индексы на родительских таблицах наследуются всеми секциями
+CREATE INDEX IF NOT EXISTS idx_exercises_user_created ON t_p7147437_shag_to_speak.exercises(user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_exercises_word_correct ON t_p7147437_shag_to_speak.exercises(word_id, is_correct);
+CREATE INDEX IF NOT EXISTS idx_exercises_archive_user_created ON t_p7147437_shag_to_speak.exercises_archive(user_id, created_at);
+
+-- Возвращаем триггеры сводок и версии данных на новую таблицу
+CREATE TRIGGER trg_exercises_rollups
+AFTER INSERT ON t_p7147437_shag_to_speak.exercises
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.apply_exercise_rollups();
+
+CREATE TRIGGER trg_exercises_version_insert
+AFTER INSERT ON t_p7147437_shag_to_speak.exercises
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.bump_user_data_version();
+
+-- Пересборка сводок учитывает и архивные секции
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.rebuild_exercise_rollups(p_user_id INTEGER DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    rebuilt INTEGER;
+BEGIN
+    CREATE TEMPORARY TABLE history ON COMMIT DROP AS
+    SELECT user_id, word_id, is_correct, created_at
+    FROM t_p7147437_shag_to_speak.exercises
+    WHERE p_user_id IS NULL OR user_id = p_user_id
+    UNION ALL
+    SELECT user_id, word_id, is_correct, created_at
+    FROM t_p7147437_shag_to_speak.exercises_archive
+    WHERE p_user_id IS NULL OR user_id = p_user_id;
+
+    UPDATE t_p7147437_shag_to_speak.users u
+    SET exercises_total = COALESCE(c.total, 0),
+        exercises_correct = COALESCE(c.correct, 0)
+    FROM t_p7147437_shag_to_speak.users uu
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS total, COUNT(*) FILTER (WHERE is_correct) AS correct
+        FROM history
+        GROUP BY user_id
+    ) c ON c.user_id = uu.id
+    WHERE u.id = uu.id AND (p_user_id IS NULL OR uu.id = p_user_id);
+    GET DIAGNOSTICS rebuilt = ROW_COUNT;
+
+    DELETE FROM t_p7147437_shag_to_speak.user_daily_activity
+    WHERE p_user_id IS NULL OR user_id = p_user_id;
+
+    INSERT INTO t_p7147437_shag_to_speak.user_daily_activity (user_id, day, exercise_count, correct_count)
+    SELECT user_id, created_at::date, COUNT(*), COUNT(*) FILTER (WHERE is_correct)
+    FROM history
+    GROUP BY user_id, created_at::date;
+
+    UPDATE t_p7147437_shag_to_speak.word_progress
+    SET correct_count = 0, total_count = 0
+    WHERE p_user_id IS NULL OR user_id = p_user_id;
+
+    INSERT INTO t_p7147437_shag_to_speak.word_progress (user_id, word_id, correct_count, total_count, last_reviewed)
+    SELECT user_id, word_id, COUNT(*) FILTER (WHERE is_correct), COUNT(*), MAX(created_at)
+    FROM history
+    GROUP BY user_id, word_id
+    ON CONFLICT (user_id, word_id) DO UPDATE
+    SET correct_count = EXCLUDED.correct_count,
+        total_count = EXCLUDED.total_count,
+        last_reviewed = GREATEST(word_progress.last_reviewed, EXCLUDED.last_reviewed);
+
+    DROP TABLE history;
+    RETURN rebuilt;
+END;
+$$;
\ No newline at end of file
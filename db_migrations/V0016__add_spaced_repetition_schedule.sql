@@ -0,0 +1,41 @@
+-- Состояние интервального повторения SM-2 для слова
+ALTER TABLE t_p7147437_shag_to_speak.word_progress 
+ADD COLUMN IF NOT EXISTS ease_factor REAL NOT NULL DEFAULT 2.5,
+ADD COLUMN IF NOT EXISTS interval_days REAL NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS repetitions INTEGER NOT NULL DEFAULT 0;
+
+-- Выборка слов к повторению: диапазон по (user_id, next_review) только среди запланированных
+CREATE INDEX IF NOT EXISTS idx_word_progress_user_next_review ON t_p7147437_shag_to_speak.word_progress(user_id, next_review)
+WHERE next_review IS NOT NULL;
+DROP INDEX IF EXISTS t_p7147437_shag_to_speak.idx_word_progress_next_review;
+
+-- Выученные слова снимаются с расписания, чтобы не копиться в начале индекса
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.clear_done_word_schedule()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE t_p7147437_shag_to_speak.word_progress p
+    SET next_review = NULL
+    FROM new_rows n
+    JOIN old_rows o ON o.id = n.id
+    WHERE p.word_id = n.id
+      AND p.user_id = n.user_id
+      AND n.status = 'done'
+      AND o.status IS DISTINCT FROM 'done'
+      AND p.next_review IS NOT NULL;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_words_clear_done_schedule ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_clear_done_schedule
+AFTER UPDATE ON t_p7147437_shag_to_speak.words
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION t_p7147437_shag_to_speak.clear_done_word_schedule();
+
+-- Снимаем с расписания уже выученные слова
+UPDATE t_p7147437_shag_to_speak.word_progress p
+SET next_review = NULL
+FROM t_p7147437_shag_to_speak.words w
+WHERE w.id = p.word_id AND w.status = 'done' AND p.next_review IS NOT NULL;
\ No newline at end of file
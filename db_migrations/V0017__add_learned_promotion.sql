@@ -0,0 +1,37 @@
+-- Кандидаты на автоматический перевод в выученные: изучаемые слова с достаточным числом повторений
+CREATE INDEX IF NOT EXISTS idx_words_learning_recalls ON t_p7147437_shag_to_speak.words(recall_count)
+WHERE status = 'learning';
+
+-- Пакетный перевод слов в выученные по правилу shouldMarkAsLearned: повторений не меньше p_min_recalls,
+-- доля верных не ниже p_min_success_rate, слову не меньше p_min_age_days дней, с последнего повторения прошло p_min_rest_hours часов
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.promote_learned_words(
+    p_batch_size INTEGER DEFAULT 1000,
+    p_min_recalls INTEGER DEFAULT 8,
+    p_min_success_rate REAL DEFAULT 0.8,
+    p_min_age_days INTEGER DEFAULT 3,
+    p_min_rest_hours INTEGER DEFAULT 24
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    promoted INTEGER;
+BEGIN
+    UPDATE t_p7147437_shag_to_speak.words w
+    SET status = 'done'
+    WHERE w.id IN (
+        SELECT cw.id
+        FROM t_p7147437_shag_to_speak.words cw
+        JOIN t_p7147437_shag_to_speak.word_progress p ON p.user_id = cw.user_id AND p.word_id = cw.id
+        WHERE cw.status = 'learning'
+          AND cw.recall_count >= p_min_recalls
+          AND p.correct_count >= p_min_success_rate * cw.recall_count
+          AND cw.created_at <= CURRENT_TIMESTAMP - make_interval(days => p_min_age_days)
+          AND (cw.last_recall_date IS NULL OR cw.last_recall_date <= CURRENT_TIMESTAMP - make_interval(hours => p_min_rest_hours))
+        LIMIT p_batch_size
+        FOR UPDATE OF cw SKIP LOCKED
+    );
+    GET DIAGNOSTICS promoted = ROW_COUNT;
+    RETURN promoted;
+END;
+$$;
\ No newline at end of file
@@ -0,0 +1,7 @@
+-- Заранее собранная следующая сессия упражнений пользователя; актуальна, пока data_version совпадает с users.data_version
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.exercise_sessions (
+    user_id INTEGER PRIMARY KEY REFERENCES t_p7147437_shag_to_speak.users(id),
+    data_version BIGINT NOT NULL,
+    exercises JSONB NOT NULL,
+    built_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
\ No newline at end of file
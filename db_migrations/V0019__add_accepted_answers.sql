@@ -0,0 +1,50 @@
+-- Нормализованные варианты принимаемого ответа: синонимы через запятую, точку с запятой и слеш, без пунктуации, ё как е
+ALTER TABLE t_p7147437_shag_to_speak.words 
+ADD COLUMN IF NOT EXISTS accepted_answers TEXT[] NOT NULL DEFAULT '{}';
+
+-- Нормализация ответа: нижний регистр, ё -> е, пунктуация и пробелы схлопываются в один пробел; совпадает с normalize_answer в exercises
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.normalize_answer(p_text TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT btrim(regexp_replace(translate(lower(p_text), 'ё', 'е'), '[\s.,;:!?"''«»„“”()\[\]{}…—–/\\]+', ' ', 'g'))
+$$;
+
+-- Варианты перевода: весь перевод и каждый синоним, с пояснениями в скобках и без них
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.answer_variants(p_translation TEXT)
+RETURNS TEXT[]
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT COALESCE(array_agg(DISTINCT variant) FILTER (WHERE variant <> ''), '{}')
+    FROM (
+        SELECT t_p7147437_shag_to_speak.normalize_answer(parts.part) AS variant
+        FROM unnest(ARRAY[p_translation, regexp_replace(p_translation, '\([^)]*\)', ' ', 'g')]) AS source(value)
+        CROSS JOIN LATERAL (
+            SELECT source.value
+            UNION ALL
+            SELECT regexp_split_to_table(source.value, '[,;/]')
+        ) AS parts(part)
+    ) variants
+$$;
+
+-- Триггерная функция: пересчитывает варианты ответа при вставке слова и изменении перевода
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.set_accepted_answers()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.accepted_answers := t_p7147437_shag_to_speak.answer_variants(NEW.russian_translation);
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_words_accepted_answers ON t_p7147437_shag_to_speak.words;
+CREATE TRIGGER trg_words_accepted_answers
+BEFORE INSERT OR UPDATE OF russian_translation ON t_p7147437_shag_to_speak.words
+FOR EACH ROW EXECUTE FUNCTION t_p7147437_shag_to_speak.set_accepted_answers();
+
+-- Заполнение для существующих слов; рост data_version заодно сбрасывает собранные сессии упражнений
+UPDATE t_p7147437_shag_to_speak.words 
+SET accepted_answers = t_p7147437_shag_to_speak.answer_variants(russian_translation);
\ No newline at end of file
@@ -0,0 +1,7 @@
+-- Заявки на генерацию по запросу: кто первым занял ключ, тот вызывает GenAPI, остальные ждут результат в prompt_cache до истечения lease_until
+CREATE TABLE IF NOT EXISTS t_p7147437_shag_to_speak.prompt_claims (
+    prompt_key VARCHAR(500) NOT NULL,
+    word_count INTEGER NOT NULL,
+    lease_until TIMESTAMP NOT NULL,
+    PRIMARY KEY (prompt_key, word_count)
+);
\ No newline at end of file
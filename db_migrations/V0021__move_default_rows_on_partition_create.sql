@@ -0,0 +1,47 @@
+-- Создание секции за месяц, возвращает TRUE, если секция создана; строки этого месяца из секции по умолчанию переносятся в отдельно созданную таблицу до присоединения, иначе ATTACH нарушит ограничение секции по умолчанию
+CREATE OR REPLACE FUNCTION t_p7147437_shag_to_speak.create_exercises_partition(p_month DATE)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE := date_trunc('month', p_month)::date;
+    month_end DATE := (date_trunc('month', p_month) + INTERVAL '1 month')::date;
+    partition_name TEXT := 'exercises_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    IF to_regclass('t_p7147437_shag_to_speak.' || partition_name) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM t_p7147437_shag_to_speak.exercises_default
+        WHERE created_at >= month_start AND created_at < month_end
+    ) THEN
+        EXECUTE format(
+            'CREATE TABLE t_p7147437_shag_to_speak.%I PARTITION OF t_p7147437_shag_to_speak.exercises FOR VALUES FROM (%L) TO (%L)',
+            partition_name, month_start, month_end
+        );
+        RETURN TRUE;
+    END IF;
+
+    LOCK TABLE t_p7147437_shag_to_speak.exercises IN SHARE ROW EXCLUSIVE MODE;
+    EXECUTE format(
+        'CREATE TABLE t_p7147437_shag_to_speak.%I (LIKE t_p7147437_shag_to_speak.exercises INCLUDING DEFAULTS)',
+        partition_name
+    );
+    EXECUTE format(
+        'WITH moved AS (
+             DELETE FROM t_p7147437_shag_to_speak.exercises_default
+             WHERE created_at >= %L AND created_at < %L
+             RETURNING id, user_id, word_id, exercise_type, is_correct, user_answer, created_at
+         )
+         INSERT INTO t_p7147437_shag_to_speak.%I (id, user_id, word_id, exercise_type, is_correct, user_answer, created_at)
+         SELECT id, user_id, word_id, exercise_type, is_correct, user_answer, created_at FROM moved',
+        month_start, month_end, partition_name
+    );
+    EXECUTE format(
+        'ALTER TABLE t_p7147437_shag_to_speak.exercises ATTACH PARTITION t_p7147437_shag_to_speak.%I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, month_start, month_end
+    );
+    RETURN TRUE;
+END;
+$$;
\ No newline at end of file
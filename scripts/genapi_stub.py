@@ -0,0 +1,207 @@
+"""
+Business: Локальная заглушка GenAPI для нагрузочных тестов без расхода квоты
+Args: порт, распределение задержек, доли ошибок, битого JSON и ответов в ```json (см. --help)
+Returns: детерминированные ответы /api/v1/networks/o1-mini и /api/v1/chat/completions
+
+Запуск: python scripts/genapi_stub.py --port 8090 --latency-dist lognormal --latency-mean 2
+Функции направляются на заглушку через GENAPI_BASE_URL=http://127.0.0.1:8090
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+VOCABULARY = [
+    'journey', 'ticket', 'luggage', 'harbor', 'compass', 'border', 'guide', 'station',
+    'meeting', 'budget', 'contract', 'invoice', 'deadline', 'partner', 'market', 'profit',
+    'server', 'network', 'database', 'browser', 'keyboard', 'cloud', 'backup', 'update',
+    'recipe', 'kitchen', 'flavor', 'spoon', 'dessert', 'harvest', 'garden', 'forest',
+    'courage', 'kindness', 'patience', 'wisdom', 'balance', 'freedom', 'memory', 'promise'
+]
+
+class StubConfig:
+    def __init__(self, args: argparse.Namespace):
+        self.latency_dist = args.latency_dist
+        self.latency_mean = args.latency_mean
+        self.latency_stddev = args.latency_stddev
+        self.latency_max = args.latency_max
+        self.error_rate = args.error_rate
+        self.malformed_rate = args.malformed_rate
+        self.fence_rate = args.fence_rate
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+    
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return self.rng.random() < rate
+    
+    def error_status(self) -> int:
+        with self.lock:
+            return self.rng.choice([429, 500, 502, 503])
+    
+    def latency(self) -> float:
+        with self.lock:
+            if self.latency_dist == 'fixed':
+                value = self.latency_mean
+            elif self.latency_dist == 'uniform':
+                value = self.rng.uniform(
+                    max(0.0, self.latency_mean - self.latency_stddev),
+                    self.latency_mean + self.latency_stddev
+                )
+            elif self.latency_dist == 'normal':
+                value = self.rng.gauss(self.latency_mean, self.latency_stddev)
+            else:
+                sigma = self.latency_stddev / self.latency_mean if self.latency_mean else 0.0
+                value = self.latency_mean * self.rng.lognormvariate(0.0, sigma)
+        return min(max(0.0, value), self.latency_max)
+
+def stable_seed(text: str) -> int:
+    return int(hashlib.sha256(text.encode()).hexdigest()[:12], 16)
+
+def word_entry(word: str) -> Dict[str, Any]:
+    return {
+        'word': word,
+        'translation': f'перевод «{word}»',
+        'examples': [
+            f'I use the word {word} every day.',
+            f'This {word} is important.',
+            f'She wrote about {word} yesterday.'
+        ]
+    }
+
+def topic_words(topic: str, count: int) -> List[str]:
+    rng = random.Random(stable_seed(topic))
+    words = rng.sample(VOCABULARY, min(count, len(VOCABULARY)))
+    words += [f'{topic.split()[0] if topic.split() else "word"}{i}' for i in range(count - len(words))]
+    return words
+
+def extract_json_list(prompt: str) -> Optional[List[str]]:
+    match = re.search(r'\[(?:\s*"(?:[^"\\]|\\.)*"\s*,?)+\]', prompt)
+    if not match:
+        return None
+    try:
+        return [str(w) for w in json.loads(match.group(0))]
+    except ValueError:
+        return None
+
+def build_content(prompt: str) -> str:
+    batch = extract_json_list(prompt)
+    if batch is not None and ('английские слова' in prompt or 'English words' in prompt):
+        return json.dumps([word_entry(w) for w in batch], ensure_ascii=False)
+    
+    match = re.search(r'запроса пользователя: "(.*?)" - подбери (\d+)', prompt, re.S)
+    if match:
+        return json.dumps([word_entry(w) for w in topic_words(match.group(1), int(match.group(2)))], ensure_ascii=False)
+    
+    match = re.search(r'английское слово "(.*?)"', prompt)
+    if match:
+        entry = word_entry(match.group(1))
+        return json.dumps({'translation': entry['translation'], 'examples': entry['examples']}, ensure_ascii=False)
+    
+    match = re.search(r"example sentences using (?:the word )?'(.*?)'", prompt)
+    if match:
+        return '\n'.join(word_entry(match.group(1))['examples'])
+    
+    match = re.search(r'\(only translation[^)]*\): (.*)$', prompt, re.S)
+    if match:
+        return word_entry(match.group(1).strip())['translation']
+    
+    return 'ok'
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    config: StubConfig
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_POST(self) -> None:
+        length = int(self.headers.get('Content-Length', '0'))
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            prompt = payload['messages'][-1]['content']
+        except (ValueError, KeyError, IndexError, TypeError):
+            self.send_json(400, {'error': 'Bad request'})
+            return
+        
+        if self.path not in ('/api/v1/networks/o1-mini', '/api/v1/chat/completions'):
+            self.send_json(404, {'error': 'Not found'})
+            return
+        
+        time.sleep(self.config.latency())
+        
+        if self.config.roll(self.config.error_rate):
+            status = self.config.error_status()
+            self.send_json(status, {'error': f'Stub failure {status}'})
+            return
+        
+        content = build_content(prompt)
+        if self.config.roll(self.config.malformed_rate):
+            content = content[:max(1, len(content) * 2 // 3)]
+        if self.config.roll(self.config.fence_rate):
+            content = f'```json\n{content}\n```'
+        
+        if self.path == '/api/v1/chat/completions' and payload.get('stream'):
+            self.stream_content(content)
+        elif self.path == '/api/v1/chat/completions':
+            self.send_json(200, {'choices': [{'message': {'role': 'assistant', 'content': content}}]})
+        else:
+            self.send_json(200, {'output': {'choices': [{'message': {'role': 'assistant', 'content': content}}]}})
+    
+    def stream_content(self, content: str) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        
+        events = [
+            json.dumps({'choices': [{'delta': {'content': content[i:i + 24]}}]}, ensure_ascii=False)
+            for i in range(0, len(content), 24)
+        ] + ['[DONE]']
+        for event in events:
+            chunk = f'data: {event}\n\n'.encode()
+            self.wfile.write(f'{len(chunk):X}\r\n'.encode() + chunk + b'\r\n')
+            self.wfile.flush()
+            time.sleep(0.02)
+        self.wfile.write(b'0\r\n\r\n')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Local GenAPI stand-in')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--latency-dist', choices=['fixed', 'uniform', 'normal', 'lognormal'], default='fixed')
+    parser.add_argument('--latency-mean', type=float, default=0.0, help='seconds')
+    parser.add_argument('--latency-stddev', type=float, default=0.0, help='seconds')
+    parser.add_argument('--latency-max', type=float, default=60.0, help='seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--malformed-rate', type=float, default=0.0)
+    parser.add_argument('--fence-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    StubHandler.config = StubConfig(args)
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    print(f'GenAPI stub listening on http://{args.host}:{args.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+"""
+Business: Регрессионная проверка планов запросов - прогоняет реальные обработчики на большом наборе данных и EXPLAIN'ит каждый их запрос
+Args: DSN пустой локальной базы Postgres, объём данных и бюджет буферов (см. --help)
+Returns: код выхода 1, если запрос ушёл в Seq Scan по большой таблице, превысил бюджет буферов
+или обработчик упал либо ответил не тем статусом
+
+Запуск: python scripts/plan_check.py --dsn postgresql://localhost/plan_check --reset
+Схема t_p7147437_shag_to_speak создаётся заново из db_migrations/, поэтому базу нужно выделить под проверку
+GenAPI подменяется заглушкой scripts/genapi_stub.py, поднятой в том же процессе
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATIONS_DIR = os.path.join(ROOT_DIR, 'db_migrations')
+SCHEMA = 't_p7147437_shag_to_speak'
+SEARCH_PATH = f'-c search_path={SCHEMA},public'
+PASSWORD = 'plan-check'
+EXPLAINABLE = re.compile(r'^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b', re.I)
+
+class PlanRecord:
+    def __init__(self, scenario: str, statement: str, plan: Optional[List[Dict[str, Any]]], error: Optional[str]):
+        self.scenario = scenario
+        self.statement = statement
+        self.plan = plan
+        self.error = error
+    
+    def nodes(self) -> List[Dict[str, Any]]:
+        if not self.plan:
+            return []
+        pending = [self.plan[0]['Plan']]
+        found = []
+        while pending:
+            node = pending.pop()
+            found.append(node)
+            pending.extend(node.get('Plans', []))
+        return found
+    
+    def buffers(self) -> int:
+        if not self.plan:
+            return 0
+        root = self.plan[0]['Plan']
+        return root.get('Shared Hit Blocks', 0) + root.get('Shared Read Blocks', 0)
+    
+    def rows_written(self) -> int:
+        return sum(
+            int(child.get('Actual Rows', 0) * child.get('Actual Loops', 1))
+            for node in self.nodes() if node['Node Type'] == 'ModifyTable'
+            for child in node.get('Plans', [])[:1]
+        )
+    
+    def seq_scans(self) -> List[str]:
+        return [node['Relation Name'] for node in self.nodes() if node['Node Type'] == 'Seq Scan']
+
+class Tracer:
+    def __init__(self):
+        self.scenario = ''
+        self.records: List[PlanRecord] = []
+        self.failures: List[str] = []
+    
+    def explain(self, conn, statement: str) -> None:
+        if not self.scenario or not EXPLAINABLE.match(statement) or statement.strip() == 'SELECT 1':
+            return
+        cursor = extensions.cursor(conn)
+        plan, error = None, None
+        try:
+            cursor.execute('SAVEPOINT plan_check')
+            try:
+                cursor.execute('EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ' + statement)
+                plan = cursor.fetchone()[0]
+            except psycopg2.Error as e:
+                error = str(e).strip().splitlines()[0]
+            cursor.execute('ROLLBACK TO SAVEPOINT plan_check')
+            cursor.execute('RELEASE SAVEPOINT plan_check')
+        finally:
+            cursor.close()
+        self.records.append(PlanRecord(self.scenario, statement, plan, error))
+
+TRACER = Tracer()
+_traced_factories: Dict[type, type] = {}
+
+class TracingCursorMixin:
+    def execute(self, query, vars=None):
+        statement = self.mogrify(query, vars)
+        TRACER.explain(self.connection, statement.decode() if isinstance(statement, bytes) else statement)
+        return super().execute(query, vars)
+
+def traced(factory: type) -> type:
+    if factory not in _traced_factories:
+        _traced_factories[factory] = type(f'Traced{factory.__name__}', (TracingCursorMixin, factory), {})
+    return _traced_factories[factory]
+
+class TracingConnection(extensions.connection):
+    def cursor(self, *args, **kwargs):
+        factory = kwargs.pop('cursor_factory', None) or self.cursor_factory or extensions.cursor
+        return super().cursor(*args, cursor_factory=traced(factory), **kwargs)
+
+def prepare_schema(conn, reset: bool) -> None:
+    with conn.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM pg_namespace WHERE nspname = %s', (SCHEMA,))
+        if cursor.fetchone():
+            if not reset:
+                raise SystemExit(f'schema {SCHEMA} already exists, pass --reset to drop it')
+            cursor.execute(f'DROP SCHEMA {SCHEMA} CASCADE')
+        cursor.execute(f'CREATE SCHEMA {SCHEMA}')
+        cursor.execute(f'SET search_path TO {SCHEMA}, public')
+        for name in sorted(os.listdir(MIGRATIONS_DIR)):
+            if name.endswith('.sql'):
+                with open(os.path.join(MIGRATIONS_DIR, name), encoding='utf-8') as f:
+                    cursor.execute(f.read())
+    conn.commit()
+
+def seed(conn, users: int, words_per_user: int, hot_words: int, exercises_per_word: int) -> None:
+    password_hash = hashlib.sha256(PASSWORD.encode()).hexdigest()
+    with conn.cursor() as cursor:
+        cursor.execute(f'SET search_path TO {SCHEMA}, public')
+        cursor.execute(
+            """INSERT INTO users (email, password_hash, name, status, created_at)
+               SELECT 'user' || g || '@plan.check', %s, 'User ' || g,
+                      CASE WHEN g = 1 THEN 'premium' ELSE 'free' END,
+                      CURRENT_TIMESTAMP - (g %% 365) * INTERVAL '1 day'
+               FROM generate_series(1, %s) g""",
+            (password_hash, users)
+        )
+        cursor.execute(
+            """INSERT INTO words (user_id, english_word, russian_translation, examples, status,
+                                  recall_count, last_recall_date, created_at)
+               SELECT u.id, 'word' || g, 'перевод ' || g, ARRAY['Example with word' || g],
+                      CASE WHEN g %% 4 = 0 THEN 'done' ELSE 'learning' END,
+                      g %% 10, CURRENT_TIMESTAMP - (g %% 90) * INTERVAL '1 day',
+                      CURRENT_TIMESTAMP - g * INTERVAL '1 minute'
+               FROM users u
+               CROSS JOIN generate_series(1, CASE WHEN u.email = 'user1@plan.check' THEN %s ELSE %s END) g
+               WHERE u.email LIKE '%%@plan.check'""",
+            (hot_words, words_per_user)
+        )
+        cursor.execute(
+            "SELECT create_exercises_partition((CURRENT_DATE - make_interval(months => g))::date) FROM generate_series(1, 6) g"
+        )
+        cursor.execute(
+            """INSERT INTO exercises (user_id, word_id, exercise_type, is_correct, user_answer, created_at)
+               SELECT w.user_id, w.id, 'mixed', random() < 0.7, w.russian_translation,
+                      CURRENT_TIMESTAMP - random() * INTERVAL '180 days'
+               FROM words w
+               CROSS JOIN generate_series(1, %s) g""",
+            (exercises_per_word,)
+        )
+        cursor.execute(
+            """INSERT INTO words (user_id, english_word, russian_translation, status)
+               SELECT id, 'plancheckspare', 'запасное слово', 'done' FROM users WHERE email = 'user1@plan.check'"""
+        )
+        cursor.execute(
+            "INSERT INTO users (email, password_hash, name, status) VALUES ('writer@plan.check', %s, 'Writer', 'premium')",
+            (password_hash,)
+        )
+    conn.commit()
+    
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute('VACUUM ANALYZE')
+    conn.autocommit = False
+
+def table_sizes(conn) -> Dict[str, float]:
+    with conn.cursor() as cursor:
+        cursor.execute(
+            """SELECT c.relname, c.reltuples
+               FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+               WHERE n.nspname = %s AND c.relkind IN ('r', 'p')""",
+            (SCHEMA,)
+        )
+        return {name: tuples for name, tuples in cursor.fetchall()}
+
+def start_genapi_stub() -> str:
+    import genapi_stub
+    
+    genapi_stub.StubHandler.config = genapi_stub.StubConfig(argparse.Namespace(
+        latency_dist='fixed', latency_mean=0.0, latency_stddev=0.0, latency_max=0.0,
+        error_rate=0.0, malformed_rate=0.0, fence_rate=0.0, seed=0
+    ))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), genapi_stub.StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_address[1]}'
+
+def load_server(dsn: str, pool_size: int) -> ModuleType:
+    os.environ['GENAPI_BASE_URL'] = start_genapi_stub()
+    os.environ['GENAPI_KEY'] = PASSWORD
+    os.environ['DATABASE_URL'] = dsn
+    os.environ.setdefault('EXERCISE_SESSION_SECRET', PASSWORD)
+    sys.path.insert(0, os.path.join(ROOT_DIR, 'server'))
+    import app
+    
+    sys.modules['db']._pool = ThreadedConnectionPool(
+        1,
+        pool_size,
+        dsn,
+        connection_factory=TracingConnection,
+        cursor_factory=RealDictCursor,
+        options=SEARCH_PATH
+    )
+    return app
+
+def make_event(method: str, user_id: int, query: Optional[Dict[str, str]] = None,
+               body: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    all_headers = {'X-User-Id': str(user_id), 'x-user-id': str(user_id)}
+    all_headers.update(headers or {})
+    return {
+        'httpMethod': method,
+        'headers': all_headers,
+        'queryStringParameters': query or {},
+        'body': json.dumps(body or {}),
+        'isBase64Encoded': False
+    }
+
+def run_scenarios(server: ModuleType, conn) -> None:
+    with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        cursor.execute(f"SELECT id FROM {SCHEMA}.users WHERE email = 'user1@plan.check'")
+        user_id = cursor.fetchone()['id']
+        cursor.execute(
+            f"""SELECT id FROM {SCHEMA}.words
+                WHERE user_id = %s AND status = 'learning'
+                ORDER BY id LIMIT 5""",
+            (user_id,)
+        )
+        word_ids = [row['id'] for row in cursor.fetchall()]
+        cursor.execute(f"SELECT id FROM {SCHEMA}.words WHERE user_id = %s AND english_word = 'plancheckspare'", (user_id,))
+        spare_id = cursor.fetchone()['id']
+        cursor.execute(f"SELECT id FROM {SCHEMA}.users WHERE email = 'writer@plan.check'")
+        writer_id = cursor.fetchone()['id']
+    conn.rollback()
+    
+    def call(scenario: str, function: str, event: Dict[str, Any], expected_status: int = 200) -> Dict[str, Any]:
+        lines: List[str] = []
+        TRACER.scenario = scenario
+        try:
+            response = server.HANDLERS[function](event, server.FunctionContext(function, lines.append))
+        except Exception as e:
+            TRACER.failures.append(f'{scenario}: handler raised {type(e).__name__}: {e}')
+            return {'statusCode': 500, 'headers': {}, 'body': '', 'lines': lines}
+        finally:
+            TRACER.scenario = ''
+        body = response.get('body') or ''
+        if response['statusCode'] != expected_status:
+            TRACER.failures.append(f'{scenario}: expected {expected_status}, got {response["statusCode"]}: {body[:120]}')
+        for line in lines + (body.splitlines() if 'ndjson' in response['headers'].get('Content-Type', '') else []):
+            if '"error"' in line:
+                TRACER.failures.append(f'{scenario}: stream error {line.strip()[:120]}')
+        return dict(response, lines=lines)
+    
+    call('auth register', 'auth', make_event('POST', user_id, body={
+        'action': 'register', 'email': 'newcomer@plan.check', 'password': PASSWORD, 'name': 'Newcomer'
+    }))
+    
+    call('auth login', 'auth', make_event('POST', user_id, body={
+        'action': 'login', 'email': 'user1@plan.check', 'password': PASSWORD
+    }))
+    
+    first_page = call('words page', 'words', make_event('GET', user_id, {'status': 'learning', 'limit': '50'}))
+    page_body = json.loads(first_page['body'] or '{}')
+    if page_body.get('next_cursor'):
+        call('words next page', 'words', make_event('GET', user_id, {
+            'status': 'learning', 'limit': '50', 'cursor': page_body['next_cursor']
+        }))
+    call('words by ids', 'words', make_event('GET', user_id, {'ids': ','.join(map(str, word_ids))}))
+    call('words not modified', 'words', make_event('GET', user_id, {'status': 'learning', 'limit': '50'},
+                                                   headers={'If-None-Match': first_page['headers'].get('ETag', '')}), 304)
+    call('words add', 'words', make_event('POST', writer_id, body={'words': ['word1', 'word2', 'plancheckfresh']}))
+    call('words add sync', 'words', make_event('POST', writer_id, body={'words': ['word3', 'plancheckinline'], 'async': False}))
+    call('words install set', 'words', make_event('POST', writer_id, body={'set_id': 'travel_airport'}))
+    
+    call('ai-words generate', 'ai-words', make_event('POST', writer_id, body={'prompt': 'plan check travel', 'count': 5}))
+    call('ai-words cached', 'ai-words', make_event('POST', writer_id, body={'prompt': 'Plan  check travel', 'count': 5}))
+    streamed = call('ai-words stream', 'ai-words', make_event('POST', writer_id, body={'prompt': 'plan check kitchen', 'count': 5, 'stream': True}))
+    streamed_words = [json.loads(line)['word'] for line in streamed['lines'] if '"word"' in line]
+    if not streamed_words:
+        TRACER.failures.append('ai-words stream: no words streamed')
+    for word in streamed_words:
+        if word['russian_translation'] != f'перевод «{word["english_word"]}»':
+            TRACER.failures.append(f'ai-words stream: unexpected translation {word["russian_translation"]!r} for {word["english_word"]}')
+    
+    call('stats', 'stats', make_event('GET', user_id))
+    
+    session = call('exercises session', 'exercises', make_event('GET', user_id, {'seed': '1'}))
+    session_body = json.loads(session['body'] or '{}')
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f'SELECT id, russian_translation FROM {SCHEMA}.words WHERE id = ANY(%s)',
+            ([exercise['word_id'] for exercise in session_body.get('exercises', [])],)
+        )
+        expected = cursor.fetchall()
+    conn.rollback()
+    call('exercises grade', 'exercises', make_event('POST', user_id, body={
+        'session_token': session_body.get('session_token', ''),
+        'answers': [{'word_id': word_id, 'answer': answer} for word_id, answer in expected]
+    }))
+    call('exercises prebuilt session', 'exercises', make_event('GET', user_id))
+    
+    call('api user-info', 'api', make_event('GET', user_id, {'action': 'user-info'}))
+    call('api words', 'api', make_event('GET', user_id, {'action': 'words', 'status': 'learning'}))
+    call('api stats', 'api', make_event('GET', user_id, {'action': 'stats'}))
+    call('api exercise-complete', 'api', make_event('PUT', user_id, {'action': 'exercise-complete'}, {'word_ids': word_ids}))
+    call('api word-status', 'api', make_event('PUT', user_id, {'action': 'word-status'}, {'word_id': word_ids[0], 'status': 'done'}))
+    call('api add-words-batch', 'api', make_event('POST', user_id, {'action': 'add-words-batch'}, {'words': 'word3,plancheckbatch'}))
+    call('api delete word', 'api', make_event('DELETE', user_id, {'action': 'word', 'word_id': str(spare_id)}))
+
+def report(sizes: Dict[str, float], seq_scan_min_rows: int, buffer_budget: int, write_buffers_per_row: int) -> int:
+    failures = 0
+    for record in TRACER.records:
+        problems = []
+        if record.error:
+            problems.append(f'error: {record.error}')
+        big_scans = sorted({name for name in record.seq_scans() if sizes.get(name, 0) >= seq_scan_min_rows})
+        if big_scans:
+            problems.append('seq scan on ' + ', '.join(big_scans))
+        budget = buffer_budget + write_buffers_per_row * record.rows_written()
+        if record.buffers() > budget:
+            problems.append(f'{record.buffers()} buffers > {budget}')
+        
+        statement = ' '.join(record.statement.split())
+        status = 'FAIL' if problems else 'ok'
+        print(f'{status:4} {record.scenario:24} {record.buffers():>7}  {statement[:90]}')
+        for problem in problems:
+            print(f'     {problem}')
+        failures += bool(problems)
+    
+    for failure in TRACER.failures:
+        print(f'FAIL {failure}')
+    failures += len(TRACER.failures)
+    
+    print(f'{len(TRACER.records)} statements checked, {len(TRACER.failures)} handler failures, {failures} failed')
+    return failures
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='EXPLAIN (ANALYZE, BUFFERS) regression check for handler queries')
+    parser.add_argument('--dsn', default=os.environ.get('PLAN_CHECK_DATABASE_URL'), help='defaults to PLAN_CHECK_DATABASE_URL')
+    parser.add_argument('--reset', action='store_true', help=f'drop and recreate schema {SCHEMA}')
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--words-per-user', type=int, default=100)
+    parser.add_argument('--hot-words', type=int, default=5000, help='vocabulary size of the user the scenarios run as')
+    parser.add_argument('--exercises-per-word', type=int, default=3)
+    parser.add_argument('--seq-scan-min-rows', type=int, default=1000)
+    parser.add_argument('--buffer-budget', type=int, default=500)
+    parser.add_argument('--write-buffers-per-row', type=int, default=40,
+                        help='extra budget per row written, for index maintenance on inserts and updates')
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error('--dsn or PLAN_CHECK_DATABASE_URL is required')
+    
+    conn = psycopg2.connect(args.dsn)
+    try:
+        prepare_schema(conn, args.reset)
+        seed(conn, args.users, args.words_per_user, args.hot_words, args.exercises_per_word)
+        sizes = table_sizes(conn)
+        run_scenarios(load_server(args.dsn, 4), conn)
+    finally:
+        conn.close()
+    
+    sys.exit(1 if report(sizes, args.seq_scan_min_rows, args.buffer_budget, args.write_buffers_per_row) else 0)
+
+if __name__ == '__main__':
+    main()
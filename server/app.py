@@ -0,0 +1,175 @@
+"""
+Business: Единый WSGI-сервер для всех облачных функций backend/ без холодных стартов
+Args: HTTP-запрос на /<function>/..., где function - ключ из backend/func2url.json
+Returns: ответ handler(event, context) соответствующей функции; NDJSON-ответы отдаются потоком
+
+Запуск: gunicorn -c server/gunicorn.conf.py server.app:app
+Для локальной отладки: python server/app.py
+"""
+
+import base64
+import importlib.util
+import json
+import os
+import queue
+import sys
+import threading
+import uuid
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from urllib.parse import parse_qsl
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+SHARED_MODULES = ('db', 'genapi', 'pagination', 'response_cache', 'session_token')
+
+class FunctionContext:
+    def __init__(self, function_name: str, stream_write: Callable[[str], None]):
+        self.request_id = str(uuid.uuid4())
+        self.function_name = function_name
+        self.stream_write = stream_write
+
+def load_module(name: str, path: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def load_functions() -> Dict[str, Callable]:
+    with open(os.path.join(BACKEND_DIR, 'func2url.json')) as f:
+        names = sorted(json.load(f))
+    
+    for shared in SHARED_MODULES:
+        for name in names:
+            path = os.path.join(BACKEND_DIR, name, f'{shared}.py')
+            if os.path.exists(path):
+                load_module(shared, path)
+                break
+    
+    handlers = {}
+    for name in names:
+        module = load_module(f'function_{name.replace("-", "_")}', os.path.join(BACKEND_DIR, name, 'index.py'))
+        handlers[name] = module.handler
+    return handlers
+
+HANDLERS = load_functions()
+
+def build_event(environ: Dict[str, Any], path: str) -> Dict[str, Any]:
+    headers = {}
+    for key, value in environ.items():
+        if key.startswith('HTTP_'):
+            header = key[5:].replace('_', '-')
+            headers[header.title()] = value
+            headers[header.lower()] = value
+    for key in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+        if environ.get(key):
+            headers[key.replace('_', '-').title()] = environ[key]
+            headers[key.replace('_', '-').lower()] = environ[key]
+    
+    query = dict(parse_qsl(environ.get('QUERY_STRING', ''), keep_blank_values=True))
+    
+    length = int(environ.get('CONTENT_LENGTH') or 0)
+    raw_body = environ['wsgi.input'].read(length) if length else b''
+    try:
+        body = raw_body.decode('utf-8')
+        is_base64 = False
+    except UnicodeDecodeError:
+        body = base64.b64encode(raw_body).decode()
+        is_base64 = True
+    
+    return {
+        'httpMethod': environ.get('REQUEST_METHOD', 'GET'),
+        'path': path or '/',
+        'headers': headers,
+        'queryStringParameters': query,
+        'body': body or '{}',
+        'isBase64Encoded': is_base64
+    }
+
+def status_line(code: int) -> str:
+    try:
+        return f'{code} {HTTPStatus(code).phrase}'
+    except ValueError:
+        return str(code)
+
+def encode_response(response: Dict[str, Any]) -> Tuple[str, List[Tuple[str, str]], bytes]:
+    body = response.get('body') or ''
+    if response.get('isBase64Encoded'):
+        payload = base64.b64decode(body)
+    elif isinstance(body, (dict, list)):
+        payload = json.dumps(body).encode()
+    else:
+        payload = str(body).encode()
+    headers = [(k, str(v)) for k, v in (response.get('headers') or {}).items() if k.lower() != 'content-length']
+    headers.append(('Content-Length', str(len(payload))))
+    return status_line(int(response.get('statusCode', 200))), headers, payload
+
+def error_response(code: int, message: str) -> Dict[str, Any]:
+    return {
+        'statusCode': code,
+        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps({'error': message}),
+        'isBase64Encoded': False
+    }
+
+def run_handler(handler: Callable, event: Dict[str, Any], name: str) -> Iterator[Tuple[str, Any]]:
+    messages: 'queue.Queue[Tuple[str, Any]]' = queue.Queue()
+    
+    def target() -> None:
+        try:
+            context = FunctionContext(name, stream_write=lambda line: messages.put(('chunk', line)))
+            messages.put(('done', handler(event, context)))
+        except Exception as e:
+            messages.put(('done', error_response(500, str(e))))
+    
+    threading.Thread(target=target, daemon=True).start()
+    while True:
+        kind, value = messages.get()
+        yield kind, value
+        if kind == 'done':
+            return
+
+def app(environ: Dict[str, Any], start_response: Callable) -> Iterator[bytes]:
+    path = environ.get('PATH_INFO', '/')
+    name, _, rest = path.lstrip('/').partition('/')
+    handler = HANDLERS.get(name)
+    
+    if handler is None:
+        status, headers, payload = encode_response(error_response(404, 'Function not found'))
+        start_response(status, headers)
+        return iter([payload])
+    
+    messages = run_handler(handler, build_event(environ, '/' + rest), name)
+    kind, value = next(messages)
+    
+    if kind == 'done':
+        status, headers, payload = encode_response(value)
+        start_response(status, headers)
+        return iter([payload])
+    
+    start_response('200 OK', [
+        ('Content-Type', 'application/x-ndjson'),
+        ('Access-Control-Allow-Origin', '*'),
+        ('Cache-Control', 'no-cache')
+    ])
+    
+    def stream(first: str) -> Iterator[bytes]:
+        yield first.encode()
+        for kind, value in messages:
+            if kind == 'chunk':
+                yield value.encode()
+    
+    return stream(value)
+
+if __name__ == '__main__':
+    from socketserver import ThreadingMixIn
+    from wsgiref.simple_server import WSGIServer, make_server
+    
+    class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+        daemon_threads = True
+    
+    port = int(os.environ.get('PORT', '8000'))
+    with make_server('0.0.0.0', port, app, server_class=ThreadingWSGIServer) as server:
+        print(f'Serving {", ".join(sorted(HANDLERS))} on http://0.0.0.0:{port}')
+        server.serve_forever()
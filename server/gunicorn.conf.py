@@ -0,0 +1,15 @@
+import multiprocessing
+import os
+
+bind = os.environ.get('SERVER_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('SERVER_WORKERS', str(multiprocessing.cpu_count() * 2 + 1)))
+worker_class = 'gthread'
+threads = int(os.environ.get('SERVER_THREADS', '8'))
+keepalive = int(os.environ.get('SERVER_KEEPALIVE', '75'))
+timeout = int(os.environ.get('SERVER_TIMEOUT', '120'))
+graceful_timeout = 30
+max_requests = int(os.environ.get('SERVER_MAX_REQUESTS', '0'))
+max_requests_jitter = max_requests // 10
+accesslog = '-'
+
+os.environ.setdefault('DB_POOL_MAX', str(threads))
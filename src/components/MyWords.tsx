@@ -27,8 +27,11 @@ interface Word {
   examples: string[];
   status: 'learning' | 'done';
   recall_count: number;
+  enrichment_status?: 'pending' | 'ready' | 'failed';
 }
 
+const ENRICHMENT_POLL_MS = 3000;
+
 const MOCK_WORDS: Word[] = [
   {
     id: 1,
@@ -78,25 +81,55 @@ const MyWords = ({ user, onNavigate, updateUser }: MyWordsProps) => {
   const [isAiDialogOpen, setIsAiDialogOpen] = useState(false);
   const [aiPrompt, setAiPrompt] = useState('');
   const [isLoading, setIsLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const { toast } = useToast();
 
   useEffect(() => {
+    setWords([]);
+    setNextCursor(null);
     loadWords();
-  }, []);
+  }, [filterStatus]);
+
+  useEffect(() => {
+    const pendingIds = words.filter(w => w.enrichment_status === 'pending').map(w => w.id);
+    if (pendingIds.length === 0) return;
+
+    const timer = setTimeout(async () => {
+      try {
+        const page = await apiClient.getWordsByIds(pendingIds);
+        const enriched = new Map(page.words.map(w => [w.id, w]));
+        setWords(current => current.map(w => {
+          const fresh = enriched.get(w.id);
+          return fresh ? {
+            ...w,
+            russian_translation: fresh.russian_translation,
+            examples: fresh.examples,
+            enrichment_status: fresh.enrichment_status
+          } : w;
+        }));
+      } catch (error) {
+        console.error('Failed to refresh pending words', error);
+      }
+    }, ENRICHMENT_POLL_MS);
 
-  const loadWords = async () => {
+    return () => clearTimeout(timer);
+  }, [words]);
+
+  const loadWords = async (cursor?: string) => {
     try {
       setIsLoading(true);
-      const apiWords = await apiClient.getWords();
-      setWords(apiWords.map(w => ({
+      const page = await apiClient.getWords(cursor, filterStatus);
+      const pageWords = page.words.map(w => ({
         id: w.id,
         english_word: w.english_word,
         russian_translation: w.russian_translation,
         examples: w.examples,
         status: w.status,
-        recall_count: w.recall_count
-      })));
-      updateUser({ word_count: apiWords.length });
+        recall_count: w.recall_count,
+        enrichment_status: w.enrichment_status
+      }));
+      setWords(cursor ? [...words, ...pageWords] : pageWords);
+      setNextCursor(page.next_cursor);
     } catch (error) {
       toast({
         title: 'Ошибка загрузки',
@@ -128,10 +161,11 @@ const MyWords = ({ user, onNavigate, updateUser }: MyWordsProps) => {
         russian_translation: w.russian_translation,
         examples: w.examples,
         status: w.status,
-        recall_count: w.recall_count
+        recall_count: w.recall_count,
+        enrichment_status: w.enrichment_status
       })), ...words]);
       
-      updateUser({ word_count: words.length + result.count });
+      updateUser({ word_count: user.word_count + result.count });
       setNewWord('');
       setIsAddDialogOpen(false);
       
@@ -169,7 +203,7 @@ const MyWords = ({ user, onNavigate, updateUser }: MyWordsProps) => {
 
   const handleDelete = (wordId: number) => {
     setWords(words.filter(w => w.id !== wordId));
-    updateUser({ word_count: words.length - 1 });
+    updateUser({ word_count: user.word_count - 1 });
     setSelectedWord(null);
     toast({
       title: 'Слово удалено',
@@ -183,7 +217,7 @@ const MyWords = ({ user, onNavigate, updateUser }: MyWordsProps) => {
 
     try {
       setIsLoading(true);
-      const result = await apiClient.addWords(set.words);
+      const result = await apiClient.installSet(set.id);
       
       setWords([...result.words.map(w => ({
         id: w.id,
@@ -191,10 +225,11 @@ const MyWords = ({ user, onNavigate, updateUser }: MyWordsProps) => {
         russian_translation: w.russian_translation,
         examples: w.examples,
         status: w.status,
-        recall_count: w.recall_count
+        recall_count: w.recall_count,
+        enrichment_status: w.enrichment_status
       })), ...words]);
       
-      updateUser({ word_count: words.length + result.count });
+      updateUser({ word_count: user.word_count + result.count });
       
       toast({
         title: 'Набор добавлен!',
@@ -240,10 +275,11 @@ const MyWords = ({ user, onNavigate, updateUser }: MyWordsProps) => {
         russian_translation: w.russian_translation,
         examples: w.examples,
         status: w.status,
-        recall_count: w.recall_count
+        recall_count: w.recall_count,
+        enrichment_status: w.enrichment_status
       })), ...words]);
       
-      updateUser({ word_count: words.length + result.count });
+      updateUser({ word_count: user.word_count + result.count });
       setAiPrompt('');
       setIsAiDialogOpen(false);
       
@@ -441,6 +477,14 @@ const MyWords = ({ user, onNavigate, updateUser }: MyWordsProps) => {
           ))}
         </div>
 
+        {nextCursor && (
+          <div className="flex justify-center mt-6">
+            <Button variant="outline" onClick={() => loadWords(nextCursor)} disabled={isLoading}>
+              {isLoading ? 'Загрузка...' : 'Показать ещё'}
+            </Button>
+          </div>
+        )}
+
         {filteredWords.length === 0 && (
           <Card className="text-center py-12">
             <CardContent>
@@ -30,6 +30,7 @@ export interface Word {
   recall_count: number;
   last_recall_date?: string;
   created_at?: string;
+  enrichment_status?: 'pending' | 'ready' | 'failed';
 }
 
 export interface Exercise {
@@ -37,7 +38,6 @@ export interface Exercise {
   type: 'translation' | 'multiple_choice';
   question: string;
   options?: string[];
-  correct_answer: string;
 }
 
 export interface ExerciseResult {
@@ -150,8 +150,12 @@ class ApiClient {
     return data;
   }
 
-  async getWords(): Promise<Word[]> {
-    const response = await fetch(API_URLS.words, {
+  async getWords(cursor?: string, status?: 'all' | 'learning' | 'done'): Promise<{ words: Word[]; next_cursor: string | null }> {
+    const params = new URLSearchParams();
+    if (cursor) params.set('cursor', cursor);
+    if (status && status !== 'all') params.set('status', status);
+    const query = params.toString();
+    const response = await fetch(query ? `${API_URLS.words}?${query}` : API_URLS.words, {
       method: 'GET',
       headers: this.getHeaders(),
     });
@@ -161,8 +165,21 @@ class ApiClient {
       throw new Error(error.error || 'Failed to get words');
     }
 
-    const data = await response.json();
-    return data.words;
+    return await response.json();
+  }
+
+  async getWordsByIds(ids: number[]): Promise<{ words: Word[]; next_cursor: string | null }> {
+    const response = await fetch(`${API_URLS.words}?ids=${ids.join(',')}`, {
+      method: 'GET',
+      headers: this.getHeaders(),
+    });
+
+    if (!response.ok) {
+      const error: ApiError = await response.json();
+      throw new Error(error.error || 'Failed to get words');
+    }
+
+    return await response.json();
   }
 
   async addWords(words: string[]): Promise<{ words: Word[]; count: number }> {
@@ -180,6 +197,21 @@ class ApiClient {
     return await response.json();
   }
 
+  async installSet(setId: string): Promise<{ words: Word[]; count: number; set_id: string }> {
+    const response = await fetch(API_URLS.words, {
+      method: 'POST',
+      headers: this.getHeaders(),
+      body: JSON.stringify({ set_id: setId }),
+    });
+
+    if (!response.ok) {
+      const error: ApiError = await response.json();
+      throw new Error(error.error || 'Failed to install word set');
+    }
+
+    return await response.json();
+  }
+
   async updateWordStatus(wordId: number, status: 'learning' | 'done'): Promise<void> {
     const response = await fetch(API_URLS.words, {
       method: 'PUT',
@@ -205,7 +237,7 @@ class ApiClient {
     }
   }
 
-  async getExercises(): Promise<{ exercises: Exercise[]; exercises_remaining: number }> {
+  async getExercises(): Promise<{ exercises: Exercise[]; session_token: string; exercises_remaining: number }> {
     const response = await fetch(API_URLS.exercises, {
       method: 'GET',
       headers: this.getHeaders(),
@@ -220,12 +252,13 @@ class ApiClient {
   }
 
   async submitAnswers(
+    sessionToken: string,
     answers: Array<{ word_id: number; answer: string }>
-  ): Promise<{ results: ExerciseResult[]; score: number; total: number; exercises_remaining: number }> {
+  ): Promise<{ results: ExerciseResult[]; score: number; total: number; learned_word_ids: number[]; exercises_remaining: number }> {
     const response = await fetch(API_URLS.exercises, {
       method: 'POST',
       headers: this.getHeaders(),
-      body: JSON.stringify({ answers }),
+      body: JSON.stringify({ session_token: sessionToken, answers }),
     });
 
     if (!response.ok) {